@@ -60,8 +60,9 @@ async def get_user_by_id(db: AsyncSession, user_id: int):
     result = await db.execute(select(models.User).where(models.User.id == user_id))
     return result.scalars().first()
 
-async def update_user(db: AsyncSession, user_id: int, user_update: dict):
-    """Update user profile information."""
+async def update_user(db: AsyncSession, user_id: int, user_update: dict,
+                      new_password: Optional[str] = None):
+    """Update user profile information, and the password when one is given."""
     result = await db.execute(select(models.User).where(models.User.id == user_id))
     user = result.scalars().first()
     if not user:
@@ -71,6 +72,8 @@ async def update_user(db: AsyncSession, user_id: int, user_update: dict):
     for key, value in user_update.items():
         if hasattr(user, key) and key != 'id' and key != 'hashed_password':
             setattr(user, key, value)
+    if new_password:
+        user.hashed_password = get_password_hash(new_password)
     
     await db.commit()
     await db.refresh(user)
@@ -123,9 +126,14 @@ async def delete_department(db: AsyncSession, dept_id: int):
     await db.commit()
     return True
 
-async def get_all_users(db: AsyncSession, exclude_user_id: Optional[int] = None, search: Optional[str] = None):
-    """Get all users with optional search and exclusion."""
-    query = select(models.User)
+async def get_all_users(db: AsyncSession, exclude_user_id: Optional[int] = None, search: Optional[str] = None,
+                        limit: Optional[int] = None, after_id: Optional[int] = None):
+    """Get all users with optional search and exclusion.
+
+    With `limit`, returns one page ordered by id; pass the last id of a page
+    as `after_id` to fetch the next one.
+    """
+    query = select(models.User).order_by(models.User.id)
     
     # Exclude specific user (typically the current user)
     if exclude_user_id:
@@ -141,6 +149,11 @@ async def get_all_users(db: AsyncSession, exclude_user_id: Optional[int] = None,
             (models.User.email.ilike(search_pattern))
         )
     
+    if after_id is not None:
+        query = query.where(models.User.id > after_id)
+    if limit is not None and limit > 0:
+        query = query.limit(limit)
+    
     result = await db.execute(query)
     return result.scalars().all()
 
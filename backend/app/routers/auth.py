@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
@@ -42,11 +42,17 @@ async def get_departments(db: AsyncSession = Depends(get_db)):
 @router.get("/users", response_model=list[schemas.UserBasic])
 async def list_users(
     search: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    """Get list of all users (excluding current user) with optional search."""
-    users = await crud.get_all_users(db, exclude_user_id=current_user.id, search=search)
+    """Get list of all users (excluding current user) with optional search.
+
+    `limit` and `after_id` page through the results in id order.
+    """
+    users = await crud.get_all_users(db, exclude_user_id=current_user.id, search=search,
+                                     limit=limit, after_id=after_id)
     return users
 
 @router.put("/change-password")
@@ -134,7 +140,8 @@ async def update_user(
         "role": user_data.role,
         "department_id": user_data.department_id
     }
-    updated_user = await crud.update_user(db, user_id, user_update)
+    updated_user = await crud.update_user(db, user_id, user_update,
+                                          new_password=user_data.password)
     if not updated_user:
         raise HTTPException(status_code=500, detail="Failed to update user")
     
@@ -1,14 +1,17 @@
 import asyncio
+import hashlib
+import json
 import logging
 import os
 from pathlib import Path
+from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Request, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, Request, Response, UploadFile
 from sqlalchemy import func, select, text, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 from ..database import async_session, get_db
 from .. import crud, models, schemas
@@ -82,6 +85,54 @@ MAX_UPLOADS_PER_USER_PER_DAY = int(os.getenv("MAX_UPLOADS_PER_USER_PER_DAY", "50
 # Maximum file size in bytes (default 100MB)
 MAX_UPLOAD_SIZE_BYTES = int(os.getenv("MAX_UPLOAD_SIZE_MB", "100")) * 1024 * 1024
 
+# Classification status stream (SSE): how often the stream re-reads the status
+# row, how often an idle stream sends a keep-alive comment, and how long a single
+# stream stays open before the client has to reconnect.
+STATUS_STREAM_CHECK_SECONDS = 0.5
+STATUS_STREAM_HEARTBEAT_SECONDS = 15
+STATUS_STREAM_MAX_SECONDS = 300
+
+TERMINAL_CLASSIFICATION_STATUSES = (
+    models.ClassificationStatus.completed,
+    models.ClassificationStatus.failed,
+)
+
+# Long-poll (?wait=N) on the status endpoint: upper bound on how long a request
+# may be held, and how often a held request re-reads the row in case the change
+# was made by another process and no in-process wakeup arrives.
+STATUS_LONG_POLL_MAX_SECONDS = 60
+STATUS_LONG_POLL_RECHECK_SECONDS = 2
+
+# doc_id -> Event set when that document's classification status changes in
+# this process. Held long-poll requests wait on it instead of re-querying.
+_status_change_events: dict[int, asyncio.Event] = {}
+# doc_id -> number of requests currently held in _wait_for_status_change, so
+# the last one to leave can drop an event nobody notified
+_status_change_waiters: dict[int, int] = {}
+
+
+def _notify_status_change(doc_id: int):
+    """Wake any long-poll requests waiting on this document's status."""
+    event = _status_change_events.pop(doc_id, None)
+    if event is not None:
+        event.set()
+
+
+async def _wait_for_status_change(doc_id: int, timeout: float):
+    """Wait until _notify_status_change(doc_id) fires or `timeout` elapses."""
+    event = _status_change_events.setdefault(doc_id, asyncio.Event())
+    _status_change_waiters[doc_id] = _status_change_waiters.get(doc_id, 0) + 1
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        _status_change_waiters[doc_id] -= 1
+        if not _status_change_waiters[doc_id]:
+            del _status_change_waiters[doc_id]
+            _status_change_events.pop(doc_id, None)
+
+
 async def _update_status(db: AsyncSession, doc_id: int, status, error=None):
     """Update classification_status atomically. Rolls back on failure (P1-REVIEW-7)."""
     try:
@@ -97,6 +148,7 @@ async def _update_status(db: AsyncSession, doc_id: int, status, error=None):
     except Exception:
         await db.rollback()
         raise
+    _notify_status_change(doc_id)
 
 
 def _sanitize_classification_error(exc: Exception) -> str:
@@ -152,6 +204,7 @@ async def classify_document_pipeline(doc_id: int, file_path: str):
             if cas_result.rowcount == 0:
                 logger.info("[run=%s] Doc %d: already past 'queued', skipping", run_id, doc_id)
                 return
+            _notify_status_change(doc_id)
 
             # Fetch department names for AI department inference
             dept_result = await db.execute(select(models.Department.name))
@@ -228,6 +281,7 @@ async def classify_document_pipeline(doc_id: int, file_path: str):
                             )
 
                 await db.commit()
+                _notify_status_change(doc_id)
 
         except asyncio.CancelledError:
             logger.warning("[run=%s] Pipeline cancelled for doc %d (shutdown?)", run_id, doc_id)
@@ -286,6 +340,7 @@ async def cleanup_orphaned_files():
 async def upload_file(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    sha256: Optional[str] = Form(None),
     db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
@@ -324,6 +379,7 @@ async def upload_file(
     safe_filename = f"{current_user.id}_{uuid4().hex[:8]}_{file.filename}"
     file_path = UPLOAD_DIR / safe_filename
     total_bytes = 0
+    hasher = hashlib.sha256() if sha256 else None
     try:
         with open(file_path, "wb") as buffer:
             while chunk := await file.read(1024 * 1024):
@@ -335,7 +391,16 @@ async def upload_file(
                         status_code=413,
                         detail=f"File too large (>{MAX_UPLOAD_SIZE_BYTES / (1024*1024):.0f}MB). Upload rejected.",
                     )
+                if hasher is not None:
+                    hasher.update(chunk)
                 buffer.write(chunk)
+        # Optional client-supplied digest: reject uploads corrupted in transit
+        if hasher is not None and hasher.hexdigest() != sha256.lower():
+            os.remove(file_path)
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded file does not match its SHA-256 checksum. Please retry the upload.",
+            )
     except HTTPException:
         raise
     except Exception as e:
@@ -421,10 +486,112 @@ async def list_department_documents(
 @limiter.limit("2/second")
 async def get_classification_status(
     request: Request,
+    response: Response,
     doc_id: int,
+    wait: int = Query(0, ge=0, le=STATUS_LONG_POLL_MAX_SECONDS),
+    since: Optional[models.ClassificationStatus] = None,
     db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
+    """Return the document's classification status.
+
+    Long-poll mode: with `wait=N` and `since=<status>`, the request is held for
+    up to N seconds until the status differs from `since`, so a client needs
+    one request per stage change instead of one per second.
+
+    Responses carry an ETag; a request whose If-None-Match still matches gets
+    an empty 304 instead of the JSON body.
+    """
+    document = await _get_owned_document_for_status(db, doc_id, current_user)
+    if wait and since is not None and document.classification_status == since:
+        # Return the pooled connection while the request is parked; each
+        # re-check below uses its own short-lived session.
+        await db.close()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while document.classification_status == since and not await request.is_disconnected():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await _wait_for_status_change(doc_id, min(remaining, STATUS_LONG_POLL_RECHECK_SECONDS))
+            async with async_session() as wait_db:
+                result = await wait_db.execute(
+                    select(models.Document).where(models.Document.id == doc_id)
+                )
+                refreshed = result.scalars().first()
+            if refreshed is None:
+                raise HTTPException(status_code=404, detail="Document not found")
+            document = refreshed
+
+    etag = _classification_status_etag(document)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return _classification_status_payload(document)
+
+
+@router.get("/documents/{doc_id}/classification-events")
+@limiter.limit("10/minute")
+async def stream_classification_status(
+    request: Request,
+    doc_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Server-Sent Events stream of classification status changes.
+
+    Pushes one ``status`` event per stage transition over a single kept-alive
+    connection, replacing client-side polling. Each event id is the status
+    value, so a reconnecting client that sends ``Last-Event-ID`` is not sent
+    the stage it has already seen. The stream closes after a terminal status
+    or STATUS_STREAM_MAX_SECONDS.
+    """
+    await _get_owned_document_for_status(db, doc_id, current_user)
+    last_sent = request.headers.get("last-event-id")
+
+    async def event_stream():
+        nonlocal last_sent
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + STATUS_STREAM_MAX_SECONDS
+        last_write = loop.time()
+        while loop.time() < deadline:
+            if await request.is_disconnected():
+                return
+            # Fresh session per check — the request-scoped one may already be closed
+            async with async_session() as stream_db:
+                result = await stream_db.execute(
+                    select(models.Document).where(models.Document.id == doc_id)
+                )
+                document = result.scalars().first()
+            if document is None:
+                return
+
+            status = document.classification_status
+            if status.value != last_sent:
+                last_sent = status.value
+                payload = _classification_status_payload(document)
+                payload["status"] = status.value
+                if payload["classification"] is not None:
+                    payload["classification"] = payload["classification"].value
+                yield f"id: {status.value}\nevent: status\ndata: {json.dumps(payload)}\n\n"
+                last_write = loop.time()
+                if status in TERMINAL_CLASSIFICATION_STATUSES:
+                    return
+            elif loop.time() - last_write >= STATUS_STREAM_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_write = loop.time()
+
+            await asyncio.sleep(STATUS_STREAM_CHECK_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _get_owned_document_for_status(db: AsyncSession, doc_id: int, current_user: models.User):
+    """Fetch a document for a status check, enforcing that the caller owns it."""
     result = await db.execute(
         select(models.Document).where(models.Document.id == doc_id)
     )
@@ -434,9 +601,22 @@ async def get_classification_status(
 
     if document.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only the document owner can check classification status")
+    return document
+
+
+def _classification_status_etag(document) -> str:
+    """ETag for a status response — changes whenever its payload would."""
+    payload = _classification_status_payload(document)
+    classification = payload["classification"].value if payload["classification"] else ""
+    digest = hashlib.sha1(
+        f"{payload['status'].value}|{classification}|{payload['error'] or ''}".encode()
+    ).hexdigest()[:16]
+    return f'"{digest}"'
+
 
+def _classification_status_payload(document) -> dict:
     return {
-        "doc_id": doc_id,
+        "doc_id": document.id,
         "status": document.classification_status,
         "classification": (
             document.classification
@@ -853,6 +1033,7 @@ async def retry_document_classification(
 
     if cas_result.rowcount == 0:
         raise HTTPException(status_code=409, detail="Classification retry already in progress")
+    _notify_status_change(doc_id)
 
     background_tasks.add_task(classify_document_pipeline, document.id, document.file_path)
     return {"message": "Retrying classification", "doc_id": doc_id}
@@ -42,6 +42,8 @@ class UserUpdate(BaseModel):
     username: str
     role: UserRole
     department_id: Optional[int] = None
+    # Optional new password, applied in the same commit as the profile fields
+    password: Optional[str] = None
 
 class PasswordReset(BaseModel):
     """Schema for admin password reset"""
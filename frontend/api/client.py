@@ -1,10 +1,115 @@
+import hashlib
+import json
+import mimetypes
+import os
+import socket
+import uuid
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List
 
+class _MultipartFileStream:
+    """Read-only file-like multipart/form-data body for one file field, plus
+    optional plain text fields sent ahead of it.
+
+    requests' `files=` builds the whole encoded body in memory (file size x2
+    at peak). This yields the part header, the file in chunks and the closing
+    boundary as the transport reads it, and reports its total length so the
+    request is still sent with a Content-Length.
+    """
+
+    def __init__(self, field_name: str, file_path: str, fields: Optional[Dict[str, str]] = None):
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path).replace('"', '%22')
+        mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        text_parts = ''.join(
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f'{value}\r\n'
+            for name, value in (fields or {}).items()
+        )
+        self._head = (
+            text_parts +
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f'Content-Type: {mimetype}\r\n\r\n'
+        ).encode('utf-8')
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode('utf-8')
+        self._file = open(file_path, 'rb')
+        self._length = len(self._head) + os.fstat(self._file.fileno()).st_size + len(self._tail)
+        self._pending = self._head
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        out = self._pending[:size]
+        self._pending = self._pending[size:]
+        if len(out) < size and self._file is not None:
+            data = self._file.read(size - len(out))
+            out += data
+            if len(out) < size:
+                # File exhausted: switch to the closing boundary
+                self._file.close()
+                self._file = None
+                self._pending = self._tail[size - len(out):]
+                out += self._tail[:size - len(out)]
+        return out
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests made without one."""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
 class APIClient:
+    # (connect, read) seconds. Calls without their own timeout fail fast
+    # instead of stalling a worker indefinitely; file transfers and full log
+    # fetches, where the server may take longer to produce the first byte,
+    # get more headroom. The status long-poll and stream set their own.
+    DEFAULT_TIMEOUT = (3, 10)
+    TRANSFER_TIMEOUT = (3, 60)
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
+        # One session for every view and worker thread, so status polls, the
+        # status stream and uploads reuse pooled keep-alive connections instead
+        # of paying a new TCP/TLS handshake per request.
         self.session = requests.Session()
+        adapter = _TimeoutHTTPAdapter(
+            pool_connections=2,
+            # Admin views run several API calls at once on the thread pool
+            pool_maxsize=10,
+            # Retry failed connects, and gateway errors on idempotent methods
+            # (urllib3's default allowed_methods leaves out POST/PATCH). A read
+            # retry would re-send a long-poll. Once retries run out, the last
+            # response is returned so callers still see its status code.
+            max_retries=Retry(total=2, connect=2, read=0, status=2, backoff_factor=0.2,
+                              status_forcelist=(502, 503, 504), raise_on_status=False),
+            timeout=self.DEFAULT_TIMEOUT,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def login(self, username: str, password: str) -> bool:
         """Login and store session cookie."""
@@ -75,10 +180,30 @@ class APIClient:
         return None
 
     def upload_file(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Upload a file."""
+        """Upload a file, streaming it from disk rather than loading it into memory.
+
+        The file's SHA-256 is sent alongside so the server can reject an upload
+        that was corrupted in transit.
+        """
         with open(file_path, 'rb') as f:
-            files = {'file': f}
-            response = self.session.post(f"{self.base_url}/upload", files=files)
+            # file_digest (3.11+) hashes in C with the GIL released
+            if hasattr(hashlib, 'file_digest'):
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                h = hashlib.sha256()
+                while chunk := f.read(1024 * 1024):
+                    h.update(chunk)
+                digest = h.hexdigest()
+        body = _MultipartFileStream('file', file_path, fields={'sha256': digest})
+        try:
+            response = self.session.post(
+                f"{self.base_url}/upload",
+                data=body,
+                headers={'Content-Type': body.content_type},
+                timeout=self.TRANSFER_TIMEOUT
+            )
+        finally:
+            body.close()
         if response.status_code == 200:
             return response.json()
         return None
@@ -114,7 +239,8 @@ class APIClient:
     def view_document(self, doc_id: int) -> Optional[bytes]:
         """View a document - returns file content."""
         try:
-            response = self.session.get(f"{self.base_url}/documents/view/{doc_id}")
+            response = self.session.get(f"{self.base_url}/documents/view/{doc_id}",
+                                        timeout=self.TRANSFER_TIMEOUT)
             if response.status_code == 200:
                 return response.content
             else:
@@ -131,7 +257,8 @@ class APIClient:
 
     def download_document(self, doc_id: int, save_path: str) -> bool:
         """Download a document."""
-        response = self.session.get(f"{self.base_url}/documents/download/{doc_id}")
+        response = self.session.get(f"{self.base_url}/documents/download/{doc_id}",
+                                    timeout=self.TRANSFER_TIMEOUT)
         if response.status_code == 200:
             with open(save_path, 'wb') as f:
                 f.write(response.content)
@@ -171,6 +298,23 @@ class APIClient:
             return response.json()
         return []
 
+    def search_users(self, search: Optional[str] = None, limit: int = 20,
+                     after_id: Optional[int] = None) -> list:
+        """Get one page of users matching `search`, ordered by id.
+
+        A full page means there may be more: pass the last user's id as
+        `after_id` to fetch the next one.
+        """
+        params = {"limit": limit}
+        if search:
+            params["search"] = search
+        if after_id is not None:
+            params["after_id"] = after_id
+        response = self.session.get(f"{self.base_url}/auth/users", params=params)
+        if response.status_code == 200:
+            return response.json()
+        return []
+
     def get_document_permissions(self, doc_id: int) -> list:
         """Get list of users who have access to this document."""
         response = self.session.get(f"{self.base_url}/documents/{doc_id}/permissions")
@@ -261,8 +405,9 @@ class APIClient:
         return None
     
     def admin_update_user(self, user_id: int, email: str, first_name: str, last_name: str,
-                         username: str, role: str, department_id: Optional[int] = None) -> tuple[bool, str]:
-        """Admin endpoint to update any user's profile."""
+                         username: str, role: str, department_id: Optional[int] = None,
+                         password: Optional[str] = None) -> tuple[bool, str]:
+        """Admin endpoint to update any user's profile, optionally resetting the password too."""
         data = {
             "email": email,
             "first_name": first_name,
@@ -271,6 +416,8 @@ class APIClient:
             "role": role,
             "department_id": department_id
         }
+        if password:
+            data["password"] = password
         response = self.session.put(f"{self.base_url}/auth/users/{user_id}", json=data)
         if response.status_code == 200:
             return True, "User updated successfully"
@@ -294,21 +441,38 @@ class APIClient:
         else:
             return False, response.json().get("detail", "Unknown error")
     
-    def get_classification_status(self, doc_id: int) -> Optional[Dict[str, Any]]:
+    def get_classification_status(self, doc_id: int, wait_seconds: int = 0,
+                                  since: Optional[str] = None,
+                                  etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Poll classification pipeline status.
 
+        With wait_seconds and since, long-polls: the server holds the request
+        until the status moves past `since` or wait_seconds elapse. Passing the
+        `etag` of the previous result lets the server answer 304 with no body.
+
         Returns:
-            dict with status data on success,
+            dict with status data on success (its "etag" key is the response ETag),
+            {"status": "not_modified"} on 304 (status unchanged since `etag`),
             {"status": "rate_limited"} on 429 (caller should back off),
             None on network errors (caller retries next tick).
         """
+        params = {}
+        if wait_seconds and since:
+            params = {"wait": wait_seconds, "since": since}
+        headers = {"If-None-Match": etag} if etag else {}
         try:
             response = self.session.get(
                 f"{self.base_url}/documents/{doc_id}/classification-status",
-                timeout=5  # Short timeout — polling should be fast
+                params=params,
+                headers=headers,
+                timeout=wait_seconds + 5  # Short timeout beyond the server-side hold
             )
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                data["etag"] = response.headers.get("ETag")
+                return data
+            if response.status_code == 304:
+                return {"status": "not_modified"}
             if response.status_code == 429:
                 # Rate limited by slowapi — signal caller to back off
                 return {"status": "rate_limited"}
@@ -316,6 +480,67 @@ class APIClient:
         except Exception:
             return None  # Network hiccup, retry next tick
 
+    def stream_classification_status(self, doc_id: int, last_event_id: Optional[str] = None,
+                                     on_open=None):
+        """Stream classification status changes as Server-Sent Events.
+
+        Yields (event_id, data) tuples as the server pushes each stage change,
+        over a single kept-alive connection. Returns when the server closes the
+        stream. Raises requests exceptions on connection errors and on a non-200
+        response (e.g. older servers without the stream endpoint).
+
+        `on_open`, if given, is called with the open response, so another
+        thread can interrupt the read with abort_stream().
+        """
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        with self.session.get(
+            f"{self.base_url}/documents/{doc_id}/classification-events",
+            headers=headers,
+            stream=True,
+            timeout=(5, 30)  # Read timeout > server heartbeat interval
+        ) as response:
+            if on_open is not None:
+                on_open(response)
+            response.raise_for_status()
+            event_id, data_lines = None, []
+            for line in response.iter_lines(decode_unicode=True):
+                if line is None:
+                    continue
+                if not line:
+                    # Blank line terminates an event
+                    if data_lines:
+                        yield event_id, json.loads("\n".join(data_lines))
+                    event_id, data_lines = None, []
+                elif line.startswith(":"):
+                    continue  # Keep-alive comment
+                elif line.startswith("id:"):
+                    event_id = line[3:].strip()
+                elif line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+
+    @staticmethod
+    def abort_stream(response):
+        """Interrupt a thread blocked reading a streamed response.
+
+        Safe to call from any thread. Closing the response does not wake a
+        read that is waiting for data; shutting the socket down does, and the
+        reader then sees a connection error.
+        """
+        connection = getattr(response.raw, 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is None:
+            # On a non-keep-alive response http.client hands the socket over
+            # to the response's file object
+            fp = getattr(getattr(response.raw, '_fp', None), 'fp', None)
+            sock = getattr(getattr(fp, 'raw', None), '_sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Already closed
+
     def retry_classification(self, doc_id: int) -> bool:
         """Retry classification for a failed document.
 
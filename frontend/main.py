@@ -13,6 +13,7 @@ from PyQt6.QtGui import QIcon
 from api.client import APIClient
 from views.login_window import LoginWindow
 from views.main_window import MainWindow
+from views.upload_document_view import stop_status_workers
 
 # Keep a strong reference to the main window globally
 main_window = None
@@ -27,6 +28,8 @@ def main():
 
     print("Starting application...")
     app = QApplication(sys.argv)
+    # Join classification status threads before Qt tears objects down
+    app.aboutToQuit.connect(stop_status_workers)
     
     # Set application icon
     app.setWindowIcon(QIcon('assets/icons/lock.png'))
@@ -0,0 +1,33 @@
+"""
+Shared cache for qtawesome icons and their rendered pixmaps.
+
+qta.icon() rebuilds the font glyph engine for every call, so views that
+create the same icon repeatedly fetch it from here instead. Icons can only
+be built once a QApplication exists, so entries are created on first use;
+qtawesome itself is imported on that first call as well.
+"""
+from PyQt6.QtGui import QIcon, QPixmap
+
+_ICON_CACHE: dict[tuple[str, str], QIcon] = {}
+_PIXMAP_CACHE: dict[tuple[str, str, int], QPixmap] = {}
+
+
+def cached_icon(name: str, color: str) -> QIcon:
+    """Return a shared qtawesome icon for (name, color)."""
+    key = (name, color)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        import qtawesome as qta
+        icon = qta.icon(name, color=color)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+def cached_pixmap(name: str, color: str, size: int) -> QPixmap:
+    """Return a shared square pixmap of the icon rendered at `size` px."""
+    key = (name, color, size)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = cached_icon(name, color).pixmap(size, size)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
@@ -0,0 +1,7 @@
+"""
+Input validation helpers shared by the form views.
+"""
+import re
+
+# Compiled once at import; matches "local@domain.tld" with no whitespace
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
@@ -13,6 +13,11 @@ from datetime import datetime
 import csv
 import io
 
+# Row text colors, built once instead of per table cell
+_TEXT_COLOR = QColor('#1f2937')
+_MUTED_COLOR = QColor('#6b7280')
+_FAINT_COLOR = QColor('#9ca3af')
+
 # Normalise compound backend actions like "share_with_user_5" → "share"
 _ACTION_NORMALIZE = {
     "view": "view",
@@ -52,6 +57,8 @@ class AccessLogsView(QWidget):
         super().__init__()
         self.api_client = api_client
         self.logs: list[dict] = []
+        # Lower-cased search text per log, built once per load (see _search_key)
+        self._search_keys: list[str] = []
         self.setup_ui()
 
     def setup_ui(self):
@@ -169,7 +176,7 @@ class AccessLogsView(QWidget):
         self.table.setAlternatingRowColors(False)
 
         vh = self.table.verticalHeader()
-        if vh:
+        if vh is not None:
             vh.setVisible(False)
             vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             vh.setDefaultSectionSize(48)
@@ -296,10 +303,12 @@ class AccessLogsView(QWidget):
             self.status_label.setText("Loading access logs...")
             response = self.api_client.session.get(
                 f"{self.api_client.base_url}/security/access-logs",
-                timeout=10,
+                # The whole log table comes back in one response
+                timeout=self.api_client.TRANSFER_TIMEOUT,
             )
             if response.status_code == 200:
                 self.logs = response.json()
+                self._search_keys = [self._search_key(log) for log in self.logs]
                 self._rebuild_action_filter()
                 self.apply_filters()
                 self.status_label.setText(
@@ -335,32 +344,32 @@ class AccessLogsView(QWidget):
         self.action_filter.blockSignals(False)
 
     def apply_filters(self):
-        filtered = self.logs
-
         raw_action = self.action_filter.currentData()
-        if raw_action and raw_action != "all":
-            filtered = [l for l in filtered if _normalise_action(l.get('action', '')) == raw_action]
+        action = raw_action if raw_action and raw_action != "all" else None
 
         search = self.search_input.text().lower()
-        if search:
-            def _doc_name(l):
-                d = l.get('document')
-                return d.get('filename', '') if d else (l.get('document_name') or '')
-            filtered = [
-                l for l in filtered
-                if search in _doc_name(l).lower()
-                or search in f"{l.get('user', {}).get('first_name', '')} {l.get('user', {}).get('last_name', '')}".lower()
-                or search in l.get('action', '').lower()
-            ]
+        filtered = [
+            log for log, key in zip(self.logs, self._search_keys)
+            if (action is None or _normalise_action(log.get('action', '')) == action)
+            and search in key
+        ]
 
         self.populate_table(filtered)
 
+    @staticmethod
+    def _search_key(log: dict) -> str:
+        """Document name, user name and action, lower-cased, one per line."""
+        doc = log.get('document')
+        doc_name = doc.get('filename', '') if doc else (log.get('document_name') or '')
+        user = log.get('user') or {}
+        user_name = f"{user.get('first_name', '')} {user.get('last_name', '')}"
+        return f"{doc_name}\n{user_name}\n{log.get('action', '')}".lower()
+
     def populate_table(self, logs):
         self.table.setRowCount(0)
         for log in logs:
             row = self.table.rowCount()
             self.table.insertRow(row)
-            self.table.setRowHeight(row, 48)
 
             # Document — fall back to stored document_name if relation is NULL (deleted doc)
             doc = log.get('document')
@@ -369,7 +378,7 @@ class AccessLogsView(QWidget):
             else:
                 doc_name = log.get('document_name') or 'Deleted Document'
             doc_item = QTableWidgetItem(doc_name)
-            doc_item.setForeground(QColor('#1f2937') if doc else QColor('#9ca3af'))
+            doc_item.setForeground(_TEXT_COLOR if doc else _FAINT_COLOR)
             if not doc:
                 doc_item.setToolTip('This document has been deleted')
             self.table.setItem(row, 0, doc_item)
@@ -383,7 +392,7 @@ class AccessLogsView(QWidget):
             else:
                 name = 'Unknown'
             user_item = QTableWidgetItem(name)
-            user_item.setForeground(QColor('#6b7280'))
+            user_item.setForeground(_MUTED_COLOR)
             self.table.setItem(row, 1, user_item)
 
             # Action badge
@@ -416,7 +425,7 @@ class AccessLogsView(QWidget):
             except Exception:
                 formatted = str(ts) if ts else 'N/A'
             ts_item = QTableWidgetItem(formatted)
-            ts_item.setForeground(QColor('#9ca3af'))
+            ts_item.setForeground(_FAINT_COLOR)
             self.table.setItem(row, 3, ts_item)
 
     def showEvent(self, event):
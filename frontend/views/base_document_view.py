@@ -217,13 +217,13 @@ class BaseDocumentView(QWidget):
         """Map filtered row index to actual document and get callbacks.
 
         Wraps each callback so it always receives the correct index into
-        self.documents, regardless of the row number that ActionMenuButton
-        passes (which is the *table* row and may differ when search is active).
+        self.documents, regardless of the row number that the table's action
+        menu passes (which is the *table* row and may differ when search is active).
         """
         doc = self._filtered_docs[row]
         actual_row = self.documents.index(doc)
         raw_callbacks = self.get_action_callbacks(actual_row)
-        # Wrap: lambda ignores the row arg from ActionMenuButton, uses actual_row
+        # Wrap: lambda ignores the row arg from the action menu, uses actual_row
         return {
             key: (lambda _row, _ar=actual_row, _cb=fn: _cb(_ar))
             for key, fn in raw_callbacks.items()
@@ -412,6 +412,12 @@ class MainWindow(QMainWindow):
         else:
             self._switch_to("My Documents")
 
+    def closeEvent(self, event):
+        # The upload view sits in the stack, so its own closeEvent never runs;
+        # stop its status worker here (logout closes the window too)
+        self.upload_document_view.stop_status_updates()
+        super().closeEvent(event)
+
     def logout(self):
         global _active_main_window
         from views.login_window import LoginWindow
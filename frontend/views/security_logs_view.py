@@ -13,6 +13,11 @@ from datetime import datetime
 import json
 import csv
 
+# Row text colors, built once instead of per table cell
+_TEXT_COLOR = QColor('#1f2937')
+_MUTED_COLOR = QColor('#6b7280')
+_FAINT_COLOR = QColor('#9ca3af')
+
 # ── Activity type display mapping ──
 _ACTIVITY_STYLE: dict[str, tuple[str, str, str, str]] = {
     # activity_type → (icon, text_color, bg_color, display_label)
@@ -39,6 +44,8 @@ class SecurityLogsView(QWidget):
         super().__init__()
         self.api_client = api_client
         self.logs: list[dict] = []
+        # Lower-cased search text per log, built once per load (see _search_key)
+        self._search_keys: list[str] = []
         self.filtered_logs: list[dict] = []
         self.setup_ui()
 
@@ -157,7 +164,7 @@ class SecurityLogsView(QWidget):
         self.table.setAlternatingRowColors(False)
 
         vh = self.table.verticalHeader()
-        if vh:
+        if vh is not None:
             vh.setVisible(False)
             vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             vh.setDefaultSectionSize(48)
@@ -340,10 +347,12 @@ class SecurityLogsView(QWidget):
             self.status_label.setText("Loading security logs...")
             response = self.api_client.session.get(
                 f"{self.api_client.base_url}/security/logs",
-                timeout=10,
+                # The whole log table comes back in one response
+                timeout=self.api_client.TRANSFER_TIMEOUT,
             )
             if response.status_code == 200:
                 self.logs = response.json()
+                self._search_keys = [self._search_key(log) for log in self.logs]
                 self._rebuild_activity_filter()
                 self.apply_filters()
                 self.status_label.setText(
@@ -379,23 +388,24 @@ class SecurityLogsView(QWidget):
         self.activity_filter.blockSignals(False)
 
     def apply_filters(self):
-        filtered = self.logs
-
         raw_type = self.activity_filter.currentData()
-        if raw_type and raw_type != "all":
-            filtered = [l for l in filtered if l.get('activity_type', '') == raw_type]
+        activity_type = raw_type if raw_type and raw_type != "all" else None
 
         search = self.search_input.text().lower()
-        if search:
-            filtered = [
-                l for l in filtered
-                if search in self._user_name(l).lower()
-                or search in _display_label(l.get('activity_type', '')).lower()
-            ]
+        filtered = [
+            log for log, key in zip(self.logs, self._search_keys)
+            if (activity_type is None or log.get('activity_type', '') == activity_type)
+            and search in key
+        ]
 
         self.filtered_logs = filtered
         self.populate_table(filtered)
 
+    @classmethod
+    def _search_key(cls, log: dict) -> str:
+        """User name and activity label, lower-cased, one per line."""
+        return f"{cls._user_name(log)}\n{_display_label(log.get('activity_type', ''))}".lower()
+
     @staticmethod
     def _user_name(log: dict) -> str:
         user = log.get('user')
@@ -411,12 +421,11 @@ class SecurityLogsView(QWidget):
         for log in logs:
             row = self.table.rowCount()
             self.table.insertRow(row)
-            self.table.setRowHeight(row, 48)
 
             # User
             name = self._user_name(log)
             user_item = QTableWidgetItem(name)
-            user_item.setForeground(QColor('#1f2937'))
+            user_item.setForeground(_TEXT_COLOR)
             self.table.setItem(row, 0, user_item)
 
             # Activity badge
@@ -449,7 +458,7 @@ class SecurityLogsView(QWidget):
                     details = {}
             summary = self._details_summary(details, at)
             detail_item = QTableWidgetItem(summary)
-            detail_item.setForeground(QColor('#6b7280'))
+            detail_item.setForeground(_MUTED_COLOR)
             self.table.setItem(row, 2, detail_item)
 
             # Timestamp
@@ -460,7 +469,7 @@ class SecurityLogsView(QWidget):
             except Exception:
                 formatted = str(ts) if ts else 'N/A'
             ts_item = QTableWidgetItem(formatted)
-            ts_item.setForeground(QColor('#9ca3af'))
+            ts_item.setForeground(_FAINT_COLOR)
             self.table.setItem(row, 3, ts_item)
 
     @staticmethod
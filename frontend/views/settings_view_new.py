@@ -1,8 +1,11 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                             QLineEdit, QMessageBox, QFrame, QScrollArea, QGroupBox, QComboBox)
-from PyQt6.QtCore import Qt
-import qtawesome as qta
+                             QLineEdit, QMessageBox, QFrame, QScrollArea, QGroupBox, QComboBox,
+                             QFormLayout)
+from PyQt6.QtCore import Qt, QTimer
+from typing import Optional
 from api.client import APIClient
+from utils.icon_cache import cached_icon, cached_pixmap
+from utils.validators import EMAIL_RE
 
 class SettingsView(QWidget):
     """User settings view - Regular users can only change password. Admins can edit profile."""
@@ -13,6 +16,10 @@ class SettingsView(QWidget):
         self.current_user = None
         self.is_admin = False
         self.departments = []
+        self._dept_index: dict[int, int] = {}
+        self._dept_signature: Optional[tuple] = None
+        self._data_loaded = False
+        self._warning_box = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -23,9 +30,8 @@ class SettingsView(QWidget):
         # Header
         header_layout = QHBoxLayout()
         
-        title_icon = qta.icon('fa5s.user-cog', color='#3498db')
         icon_label = QLabel()
-        icon_label.setPixmap(title_icon.pixmap(32, 32))
+        icon_label.setPixmap(cached_pixmap('fa5s.user-cog', '#3498db', 32))
         header_layout.addWidget(icon_label)
         
         title = QLabel("My Settings")
@@ -65,108 +71,51 @@ class SettingsView(QWidget):
         
         # Profile Edit Section (Admin Only)
         self.profile_group = QGroupBox("Edit Profile")
-        self.profile_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #1f2937;
-                border: 2px solid #e0e4e7;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding: 20px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        self.profile_group.setProperty("class", "settingsCard")
         
         profile_layout = QVBoxLayout()
         profile_layout.setSpacing(15)
         
-        input_style = """
-            QLineEdit, QComboBox {
-                padding: 12px 20px;
-                border: 2px solid #d1d5db;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: white;
-                color: #1f2937;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border-color: #3498db;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-        """
+        # Label/field pairs share one form layout; labels sit above their fields
+        profile_form = QFormLayout()
+        profile_form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        profile_form.setSpacing(15)
         
         # Email
-        email_label = QLabel("Email Address:")
-        email_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        profile_layout.addWidget(email_label)
-        
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("user@example.com")
-        self.email_input.setStyleSheet(input_style)
-        profile_layout.addWidget(self.email_input)
+        profile_form.addRow("Email Address:", self.email_input)
         
         # First Name
-        fname_label = QLabel("First Name:")
-        fname_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        profile_layout.addWidget(fname_label)
-        
         self.firstname_input = QLineEdit()
         self.firstname_input.setPlaceholderText("John")
-        self.firstname_input.setStyleSheet(input_style)
-        profile_layout.addWidget(self.firstname_input)
+        profile_form.addRow("First Name:", self.firstname_input)
         
         # Last Name
-        lname_label = QLabel("Last Name:")
-        lname_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        profile_layout.addWidget(lname_label)
-        
         self.lastname_input = QLineEdit()
         self.lastname_input.setPlaceholderText("Doe")
-        self.lastname_input.setStyleSheet(input_style)
-        profile_layout.addWidget(self.lastname_input)
+        profile_form.addRow("Last Name:", self.lastname_input)
         
         # Department
-        dept_label = QLabel("Department:")
-        dept_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        profile_layout.addWidget(dept_label)
-        
         self.department_combo = QComboBox()
-        self.department_combo.setStyleSheet(input_style)
-        profile_layout.addWidget(self.department_combo)
+        profile_form.addRow("Department:", self.department_combo)
+        profile_layout.addLayout(profile_form)
+        
+        # Text fields read together by _profile_snapshot()
+        self._profile_fields = {
+            'email': self.email_input,
+            'first_name': self.firstname_input,
+            'last_name': self.lastname_input,
+        }
         
         # Save Profile Button
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
         save_profile_btn = QPushButton("Save Profile")
-        save_profile_btn.setIcon(qta.icon('fa5s.save', color='white'))
-        save_profile_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 180px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
-        save_profile_btn.clicked.connect(self.update_profile)
+        save_profile_btn.setIcon(cached_icon('fa5s.save', 'white'))
+        save_profile_btn.setProperty("class", "primaryButton")
+        save_profile_btn.clicked.connect(self.update_profile, Qt.ConnectionType.UniqueConnection)
         button_layout.addWidget(save_profile_btn)
         button_layout.addStretch()
         
@@ -177,81 +126,37 @@ class SettingsView(QWidget):
         
         # User Information (Read-Only Display)
         info_group = QGroupBox("Your Profile")
-        info_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #1f2937;
-                border: 2px solid #e0e4e7;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding: 20px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        info_group.setProperty("class", "settingsCard")
         
         info_layout = QVBoxLayout()
         info_layout.setSpacing(15)
         
         # Display user info
         self.username_label = QLabel()
-        self.username_label.setStyleSheet("""
-            font-size: 14px;
-            color: #34495e;
-            padding: 10px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        self.username_label.setProperty("class", "infoPill")
         info_layout.addWidget(self.username_label)
         
         self.email_label = QLabel()
-        self.email_label.setStyleSheet("""
-            font-size: 14px;
-            color: #34495e;
-            padding: 10px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        self.email_label.setProperty("class", "infoPill")
         info_layout.addWidget(self.email_label)
         
         self.name_label = QLabel()
-        self.name_label.setStyleSheet("""
-            font-size: 14px;
-            color: #34495e;
-            padding: 10px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        self.name_label.setProperty("class", "infoPill")
         info_layout.addWidget(self.name_label)
         
         self.dept_label = QLabel()
-        self.dept_label.setStyleSheet("""
-            font-size: 14px;
-            color: #34495e;
-            padding: 10px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        self.dept_label.setProperty("class", "infoPill")
         info_layout.addWidget(self.dept_label)
         
         self.role_label = QLabel()
-        self.role_label.setStyleSheet("""
-            font-size: 14px;
-            color: #34495e;
-            padding: 10px;
-            background-color: #ecf0f1;
-            border-radius: 6px;
-        """)
+        self.role_label.setProperty("class", "infoPill")
         info_layout.addWidget(self.role_label)
         
         # Info message
         info_message = QLabel("ℹ️ To update your profile information (email, name, department), please contact an administrator.")
         info_message.setStyleSheet("""
             font-size: 13px;
+            font-weight: normal;
             color: #16a085;
             padding: 12px;
             background-color: #d1f2eb;
@@ -266,78 +171,39 @@ class SettingsView(QWidget):
         
         # Change Password Section
         password_group = QGroupBox("Change Password")
-        password_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #1f2937;
-                border: 2px solid #e0e4e7;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding: 20px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        password_group.setProperty("class", "settingsCard")
         
         password_layout = QVBoxLayout()
         password_layout.setSpacing(15)
         
-        input_style = """
-            QLineEdit {
-                padding: 12px 20px;
-                border: 2px solid #d1d5db;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: white;
-                color: #1f2937;
-                min-height: 20px;
-            }
-            QLineEdit:focus {
-                border-color: #3498db;
-            }
-        """
+        password_form = QFormLayout()
+        password_form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        password_form.setSpacing(15)
         
         # Current Password
-        current_pwd_label = QLabel("Current Password:")
-        current_pwd_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        password_layout.addWidget(current_pwd_label)
-        
         self.current_password_input = QLineEdit()
         self.current_password_input.setPlaceholderText("Enter your current password")
         self.current_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.current_password_input.setStyleSheet(input_style)
-        password_layout.addWidget(self.current_password_input)
+        password_form.addRow("Current Password:", self.current_password_input)
         
         # New Password
-        new_pwd_label = QLabel("New Password:")
-        new_pwd_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        password_layout.addWidget(new_pwd_label)
-        
         self.new_password_input = QLineEdit()
         self.new_password_input.setPlaceholderText("Enter new password")
         self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.new_password_input.setStyleSheet(input_style)
-        password_layout.addWidget(self.new_password_input)
+        password_form.addRow("New Password:", self.new_password_input)
         
         # Confirm Password
-        confirm_pwd_label = QLabel("Confirm New Password:")
-        confirm_pwd_label.setStyleSheet("font-weight: bold; font-size: 13px; color: #34495e;")
-        password_layout.addWidget(confirm_pwd_label)
-        
         self.confirm_password_input = QLineEdit()
         self.confirm_password_input.setPlaceholderText("Confirm new password")
         self.confirm_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.confirm_password_input.setStyleSheet(input_style)
-        password_layout.addWidget(self.confirm_password_input)
+        password_form.addRow("Confirm New Password:", self.confirm_password_input)
+        password_layout.addLayout(password_form)
         
         # Password requirements
         password_hint = QLabel("⚠️ Password must be at least 6 characters long")
         password_hint.setStyleSheet("""
             font-size: 12px;
+            font-weight: normal;
             color: #7f8c8d;
             padding: 8px;
             background-color: #f8f9fa;
@@ -350,25 +216,9 @@ class SettingsView(QWidget):
         button_layout.addStretch()
         
         change_pwd_btn = QPushButton("Change Password")
-        change_pwd_btn.setIcon(qta.icon('fa5s.key', color='white'))
-        change_pwd_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e67e22;
-                color: white;
-                padding: 15px 30px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 180px;
-            }
-            QPushButton:hover {
-                background-color: #d35400;
-            }
-            QPushButton:pressed {
-                background-color: #ba4a00;
-            }
-        """)
-        change_pwd_btn.clicked.connect(self.change_password)
+        change_pwd_btn.setIcon(cached_icon('fa5s.key', 'white'))
+        change_pwd_btn.setProperty("class", "warningButton")
+        change_pwd_btn.clicked.connect(self.change_password, Qt.ConnectionType.UniqueConnection)
         button_layout.addWidget(change_pwd_btn)
         button_layout.addStretch()
         
@@ -380,13 +230,24 @@ class SettingsView(QWidget):
         settings_layout.addStretch()
         scroll.setWidget(settings_widget)
         main_layout.addWidget(scroll)
-        
-        # Load user data
-        self.load_user_data()
+    
+    def showEvent(self, event):
+        """Load user data lazily the first time the view is shown."""
+        super().showEvent(event)
+        if not self._data_loaded:
+            # Deferred so a refresh_data() from the same tab switch doesn't double-fetch
+            QTimer.singleShot(0, self._load_if_needed)
+    
+    def _load_if_needed(self):
+        if not self._data_loaded:
+            self.load_user_data()
     
     def load_user_data(self):
         """Load current user data for display."""
-        self.current_user = self.api_client.get_current_user()
+        self._data_loaded = True
+        user = self.api_client.get_current_user()
+        user_changed = user != self.current_user
+        self.current_user = user
         if self.current_user:
             username = self.current_user.get('username', 'N/A')
             email = self.current_user.get('email', 'N/A')
@@ -398,73 +259,96 @@ class SettingsView(QWidget):
             dept_name = dept.get('name', 'None') if dept else 'None'
             dept_id = self.current_user.get('department_id')
             
-            role = self.current_user.get('role', 'user').upper()
-            self.is_admin = self.current_user.get('role', 'user') == 'admin'
+            role = self.current_user.get('role') or 'user'
+            self.is_admin = role == 'admin'
             
-            self.username_label.setText(f"👤 Username: {username}")
-            self.email_label.setText(f"📧 Email: {email}")
-            self.name_label.setText(f"📝 Full Name: {full_name}")
-            self.dept_label.setText(f"🏢 Department: {dept_name}")
-            self.role_label.setText(f"🔑 Role: {role}")
+            if user_changed:
+                self.username_label.setText(f"👤 Username: {username}")
+                self.email_label.setText(f"📧 Email: {email}")
+                self.name_label.setText(f"📝 Full Name: {full_name}")
+                self.dept_label.setText(f"🏢 Department: {dept_name}")
+                self.role_label.setText(f"🔑 Role: {role.upper()}")
             
             # Show/hide profile edit section based on role
             if self.is_admin:
                 self.profile_group.setVisible(True)
-                self.load_departments()
-                # Populate edit fields
-                self.email_input.setText(email)
-                self.firstname_input.setText(first_name)
-                self.lastname_input.setText(last_name)
-                # Set department
-                if dept_id:
-                    index = self.department_combo.findData(dept_id)
-                    if index >= 0:
-                        self.department_combo.setCurrentIndex(index)
+                depts_changed = self.load_departments()
+                if user_changed:
+                    # Populate edit fields
+                    self.email_input.setText(email)
+                    self.firstname_input.setText(first_name)
+                    self.lastname_input.setText(last_name)
+                if user_changed or depts_changed:
+                    # Set department (unknown ids fall back to "No Department")
+                    self.department_combo.setCurrentIndex(self._dept_index.get(dept_id, 0))
             else:
                 self.profile_group.setVisible(False)
     
-    def load_departments(self):
-        """Load departments from API."""
+    def _warn(self, title: str, message: str):
+        """Show a warning through one reusable message box instead of a new dialog per call."""
+        if self._warning_box is None:
+            self._warning_box = QMessageBox(self)
+            self._warning_box.setIcon(QMessageBox.Icon.Warning)
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(message)
+        self._warning_box.exec()
+
+    def load_departments(self) -> bool:
+        """Load departments from API.
+
+        Returns True if the combo was repopulated, False if the list was
+        unchanged since the last load (or the request failed).
+        """
         try:
-            self.departments = self.api_client.get_departments()
-            self.department_combo.clear()
-            self.department_combo.addItem("No Department", None)
-            if self.departments:
-                for dept in self.departments:
-                    self.department_combo.addItem(dept['name'], dept['id'])
+            departments = self.api_client.get_departments()
+            signature = tuple((dept['id'], dept['name']) for dept in departments)
+            if signature == self._dept_signature:
+                return False
+            self.departments = departments
+            self._dept_signature = signature
+            # Populate in one batch with signals suppressed so the combo
+            # doesn't emit a change notification per inserted item
+            self.department_combo.blockSignals(True)
+            try:
+                self.department_combo.clear()
+                self.department_combo.addItem("No Department", None)
+                self.department_combo.addItems([dept['name'] for dept in self.departments])
+                self._dept_index = {}
+                for i, dept in enumerate(self.departments, start=1):
+                    self.department_combo.setItemData(i, dept['id'])
+                    self._dept_index[dept['id']] = i
+            finally:
+                self.department_combo.blockSignals(False)
+            return True
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not load departments: {e}")
+            self._warn("Error", f"Could not load departments: {e}")
+            return False
+    
+    def _profile_snapshot(self) -> dict:
+        """Read each profile field exactly once, keyed by update_profile() kwargs."""
+        profile = {key: field.text().strip() for key, field in self._profile_fields.items()}
+        profile['department_id'] = self.department_combo.currentData()
+        return profile
     
     def update_profile(self):
         """Update profile information (admin only)."""
         if not self.is_admin:
-            QMessageBox.warning(self, "Access Denied", 
-                              "Only administrators can edit profile information.")
+            self._warn("Access Denied", "Only administrators can edit profile information.")
             return
         
-        email = self.email_input.text().strip()
-        first_name = self.firstname_input.text().strip()
-        last_name = self.lastname_input.text().strip()
-        department_id = self.department_combo.currentData()
+        profile = self._profile_snapshot()
         
         # Validation
-        if not all([email, first_name, last_name]):
-            QMessageBox.warning(self, "Validation Error", 
-                              "Email, first name, and last name are required.")
+        if not all(profile[key] for key in self._profile_fields):
+            self._warn("Validation Error", "Email, first name, and last name are required.")
             return
         
-        if '@' not in email or '.' not in email:
-            QMessageBox.warning(self, "Validation Error", 
-                              "Please enter a valid email address.")
+        if not EMAIL_RE.match(profile['email']):
+            self._warn("Validation Error", "Please enter a valid email address.")
             return
         
         # Update profile via API
-        success, message = self.api_client.update_profile(
-            email=email,
-            first_name=first_name,
-            last_name=last_name,
-            department_id=department_id
-        )
+        success, message = self.api_client.update_profile(**profile)
         
         if success:
             QMessageBox.information(self, "Success", 
@@ -482,23 +366,19 @@ class SettingsView(QWidget):
         
         # Validation
         if not all([current_password, new_password, confirm_password]):
-            QMessageBox.warning(self, "Validation Error", 
-                              "Please fill in all password fields.")
+            self._warn("Validation Error", "Please fill in all password fields.")
             return
         
         if new_password != confirm_password:
-            QMessageBox.warning(self, "Validation Error", 
-                              "New passwords do not match.")
+            self._warn("Validation Error", "New passwords do not match.")
             return
         
         if len(new_password) < 6:
-            QMessageBox.warning(self, "Validation Error", 
-                              "New password must be at least 6 characters long.")
+            self._warn("Validation Error", "New password must be at least 6 characters long.")
             return
         
         if new_password == current_password:
-            QMessageBox.warning(self, "Validation Error", 
-                              "New password must be different from current password.")
+            self._warn("Validation Error", "New password must be different from current password.")
             return
         
         # Change password
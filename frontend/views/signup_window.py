@@ -1,9 +1,71 @@
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QMessageBox, QFrame, QWidget, QComboBox
-from PyQt6.QtCore import pyqtSignal, Qt, QPoint
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import pyqtSignal, Qt, QPoint, QThread, pyqtSlot
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QLinearGradient, QColor
 from api.client import APIClient
+from utils.validators import EMAIL_RE
 import requests
 
+class SignupWorker(QThread):
+    """Worker to register and then log in on a background thread."""
+    success = pyqtSignal(bool)  # True if the automatic login also succeeded
+    failed = pyqtSignal(str, str)  # (title, message)
+
+    def __init__(self, api_client, username, password, email, first_name, last_name, department_id):
+        super().__init__()
+        self.api_client = api_client
+        self.username = username
+        self.password = password
+        self.email = email
+        self.first_name = first_name
+        self.last_name = last_name
+        self.department_id = department_id
+
+    def run(self):
+        try:
+            success, message = self.api_client.signup(
+                self.username, self.password, self.email,
+                self.first_name, self.last_name, self.department_id
+            )
+            if not success:
+                self.failed.emit("Signup Failed", message)
+                return
+            # Try automatic login after successful signup
+            self.success.emit(self.api_client.login(self.username, self.password))
+        except requests.exceptions.ConnectionError:
+            self.failed.emit("Connection Error", "Could not connect to the server. Please check your connection and try again.")
+        except Exception as e:
+            self.failed.emit("Error", f"An unexpected error occurred during signup: {e}")
+
+
+class GradientBackground(QWidget):
+    """Backdrop that blits a gradient pixmap rendered once per size."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = QPixmap()
+
+    def _render_cache(self):
+        ratio = self.devicePixelRatioF()
+        self._cache = QPixmap(self.size() * ratio)
+        self._cache.setDevicePixelRatio(ratio)
+        gradient = QLinearGradient(0, 0, self.width(), self.height())
+        gradient.setColorAt(0, QColor('#f0f2f5'))
+        gradient.setColorAt(1, QColor('#e8eaf0'))
+        painter = QPainter(self._cache)
+        painter.fillRect(self.rect(), gradient)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._cache = QPixmap()
+
+    def paintEvent(self, event):
+        if self._cache.isNull():
+            self._render_cache()
+        painter = QPainter(self)
+        painter.drawPixmap(self.rect(), self._cache)
+
+
 class SignupWindow(QDialog):
     signup_successful = pyqtSignal()
 
@@ -17,6 +79,8 @@ class SignupWindow(QDialog):
         self.departments = []
         self.dragging = False
         self.drag_position = QPoint()
+        self._warning_box = None
+        self._signup_worker = None
         self.setup_ui()
         self.load_departments()
 
@@ -58,7 +122,7 @@ class SignupWindow(QDialog):
             }
             QPushButton:hover { background-color: rgba(255,255,255,0.1); }
         """)
-        minimize_btn.clicked.connect(self.showMinimized)
+        minimize_btn.clicked.connect(self.showMinimized, Qt.ConnectionType.UniqueConnection)
         title_bar_layout.addWidget(minimize_btn)
 
         close_btn = QPushButton("✕")
@@ -70,30 +134,42 @@ class SignupWindow(QDialog):
             }
             QPushButton:hover { background-color: #e74c3c; }
         """)
-        close_btn.clicked.connect(self.close)
+        close_btn.clicked.connect(self.close, Qt.ConnectionType.UniqueConnection)
         title_bar_layout.addWidget(close_btn)
 
         main_layout.addWidget(title_bar)
         
-        background = QWidget()
-        background.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f0f2f5, stop:1 #e8eaf0);
-            }
-        """)
+        background = GradientBackground()
         
         container_layout = QVBoxLayout(background)
         container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         card = QFrame()
         card.setFixedSize(400, 720)
+        # Input rules live on the card so they're parsed once for all fields
         card.setStyleSheet("""
             QFrame {
                 background-color: white;
                 border-radius: 16px;
                 border: 1px solid #e5e7eb;
             }
+            QLineEdit, QComboBox {
+                padding: 12px 20px;
+                border: 2px solid #d1d5db;
+                border-radius: 10px;
+                font-size: 14px;
+                background-color: white;
+                color: #1f2937;
+                min-height: 20px;
+            }
+            QLineEdit:focus, QComboBox:focus {
+                border-color: #27ae60;
+                outline: none;
+            }
+            QComboBox::drop-down {
+                border: none;
+                width: 30px;
+            }
         """)
         
         card_layout = QVBoxLayout(card)
@@ -113,60 +189,33 @@ class SignupWindow(QDialog):
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         card_layout.addWidget(title_label)
         
-        input_style = """
-            QLineEdit, QComboBox {
-                padding: 12px 20px;
-                border: 2px solid #d1d5db;
-                border-radius: 10px;
-                font-size: 14px;
-                background-color: white;
-                color: #1f2937;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border-color: #27ae60;
-                outline: none;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-        """
-
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Email")
-        self.email_input.setStyleSheet(input_style)
         card_layout.addWidget(self.email_input)
 
         self.firstname_input = QLineEdit()
         self.firstname_input.setPlaceholderText("Firstname")
-        self.firstname_input.setStyleSheet(input_style)
         card_layout.addWidget(self.firstname_input)
 
         self.lastname_input = QLineEdit()
         self.lastname_input.setPlaceholderText("Lastname")
-        self.lastname_input.setStyleSheet(input_style)
         card_layout.addWidget(self.lastname_input)
 
         self.department_combo = QComboBox()
-        self.department_combo.setStyleSheet(input_style)
         card_layout.addWidget(self.department_combo)
 
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
-        self.username_input.setStyleSheet(input_style)
         card_layout.addWidget(self.username_input)
 
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setPlaceholderText("Password")
-        self.password_input.setStyleSheet(input_style)
         card_layout.addWidget(self.password_input)
 
         self.confirm_password_input = QLineEdit()
         self.confirm_password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.confirm_password_input.setPlaceholderText("Confirm Password")
-        self.confirm_password_input.setStyleSheet(input_style)
         card_layout.addWidget(self.confirm_password_input)
 
         card_layout.addSpacing(20)
@@ -186,7 +235,7 @@ class SignupWindow(QDialog):
             QPushButton:pressed { background-color: #1e8449; }
             QPushButton:disabled { background-color: #d1d5db; color: #9ca3af; }
         """)
-        self.signup_button.clicked.connect(self.signup)
+        self.signup_button.clicked.connect(self.signup, Qt.ConnectionType.UniqueConnection)
         card_layout.addWidget(self.signup_button)
 
         card_layout.addSpacing(20)
@@ -209,7 +258,7 @@ class SignupWindow(QDialog):
             }
             QPushButton:hover { color: #229954; }
         """)
-        self.login_button.clicked.connect(self.accept)
+        self.login_button.clicked.connect(self.accept, Qt.ConnectionType.UniqueConnection)
 
         links_layout.addWidget(login_label)
         links_layout.addWidget(self.login_button)
@@ -220,60 +269,123 @@ class SignupWindow(QDialog):
         main_layout.addWidget(background)
         self.setLayout(main_layout)
 
+        # Text fields read (and stripped) together in signup(); keys match SignupWorker kwargs
+        self._fields = {
+            'email': self.email_input,
+            'first_name': self.firstname_input,
+            'last_name': self.lastname_input,
+            'username': self.username_input,
+        }
+
+    def _warn(self, title: str, message: str):
+        """Show a warning in the dialog's shared message box."""
+        if self._warning_box is None:
+            self._warning_box = QMessageBox(self)
+            self._warning_box.setIcon(QMessageBox.Icon.Warning)
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(message)
+        self._warning_box.exec()
+
     def load_departments(self):
         try:
             self.departments = self.api_client.get_departments()
-            self.department_combo.addItem("Select Department", None)
-            if self.departments:
-                for dept in self.departments:
-                    self.department_combo.addItem(dept['name'], dept['id'])
+            # Populate in one batch with signals suppressed so the combo
+            # doesn't emit a change notification per inserted item
+            self.department_combo.blockSignals(True)
+            try:
+                self.department_combo.addItem("Select Department", None)
+                self.department_combo.addItems([dept['name'] for dept in self.departments])
+                for i, dept in enumerate(self.departments, start=1):
+                    self.department_combo.setItemData(i, dept['id'])
+            finally:
+                self.department_combo.blockSignals(False)
         except requests.exceptions.ConnectionError:
             QMessageBox.critical(self, "Connection Error", "Could not connect to the server. Please check your connection and try again.")
             self.departments = []
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"An unexpected error occurred while loading departments: {e}")
+            self._warn("Error", f"An unexpected error occurred while loading departments: {e}")
             self.departments = []
 
     def signup(self):
-        try:
-            email = self.email_input.text().strip()
-            firstname = self.firstname_input.text().strip()
-            lastname = self.lastname_input.text().strip()
-            username = self.username_input.text().strip()
-            password = self.password_input.text()
-            confirm_password = self.confirm_password_input.text()
-            department_id = self.department_combo.currentData()
-
-            if not all([email, firstname, lastname, username, password, confirm_password]):
-                QMessageBox.warning(self, "Error", "Please fill in all fields.")
-                return
+        vals = {key: field.text().strip() for key, field in self._fields.items()}
+        password = self.password_input.text()
+        confirm_password = self.confirm_password_input.text()
 
-            if password != confirm_password:
-                QMessageBox.warning(self, "Error", "Passwords do not match.")
-                return
+        if not (all(vals.values()) and password and confirm_password):
+            self._warn("Error", "Please fill in all fields.")
+            return
 
-            success, message = self.api_client.signup(
-                username, password, email, firstname, lastname, department_id
-            )
+        if not EMAIL_RE.match(vals['email']):
+            self._warn("Error", "Please enter a valid email address.")
+            return
 
-            if success:
-                # Try automatic login after successful signup
-                if self.api_client.login(username, password):
-                    self.signup_successful.emit()
-                    self.accept()
-                else:
-                    QMessageBox.information(self, "Success", "Account created successfully. Please login.")
-                    self.accept()
-            else:
-                QMessageBox.warning(self, "Signup Failed", message)
-        except requests.exceptions.ConnectionError:
-            QMessageBox.critical(self, "Connection Error", "Could not connect to the server. Please check your connection and try again.")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"An unexpected error occurred during signup: {e}")
+        if password != confirm_password:
+            self._warn("Error", "Passwords do not match.")
+            return
+
+        # Show loading state
+        self.signup_button.setEnabled(False)
+        self.signup_button.setText("Creating account...")
+
+        # Run signup + login in background thread
+        self._signup_worker = SignupWorker(
+            self.api_client, password=password,
+            department_id=self.department_combo.currentData(), **vals
+        )
+        self._signup_worker.success.connect(self._on_signup_success)
+        self._signup_worker.failed.connect(self._on_signup_failed)
+        self._signup_worker.finished.connect(self._on_signup_worker_finished)
+        self._signup_worker.start()
+
+    def _on_signup_worker_finished(self):
+        self._signup_worker.deleteLater()
+        self._signup_worker = None
+
+    def _signup_running(self) -> bool:
+        return self._signup_worker is not None and self._signup_worker.isRunning()
+
+    @pyqtSlot(bool)
+    def _on_signup_success(self, logged_in: bool):
+        """Handle successful signup from worker thread."""
+        self._reset_signup_ui()
+        if logged_in:
+            self.signup_successful.emit()
+        else:
+            QMessageBox.information(self, "Success", "Account created successfully. Please login.")
+        self.accept()
+
+    @pyqtSlot(str, str)
+    def _on_signup_failed(self, title: str, message: str):
+        """Handle failed signup from worker thread."""
+        self._reset_signup_ui()
+        if title == "Connection Error":
+            QMessageBox.critical(self, title, message)
+        else:
+            self._warn(title, message)
+
+    def _reset_signup_ui(self):
+        """Reset signup form to idle state."""
+        self.signup_button.setEnabled(True)
+        self.signup_button.setText("Sign Up")
 
     def show_login(self):
+        if self._signup_running():
+            return
         self.accept()
 
+    def reject(self):
+        # Escape and the title-bar close button stay inert until the signup
+        # request returns, so the dialog never drops a running worker
+        if self._signup_running():
+            return
+        super().reject()
+
+    def closeEvent(self, event):
+        if self._signup_running():
+            event.ignore()
+            return
+        super().closeEvent(event)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and event.position().y() < 35:
             self.dragging = True
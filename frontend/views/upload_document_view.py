@@ -1,11 +1,15 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                               QPushButton, QFileDialog, QMessageBox, QProgressBar,
                               QFrame, QScrollArea)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import (Qt, QObject, QRunnable, QThread, QThreadPool, pyqtSignal,
+                          QMutex, QTimer, QWaitCondition)
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
-import qtawesome as qta
 from api.client import APIClient
+from utils.icon_cache import cached_icon, cached_pixmap
 import os
+import random
+import sys
+import time
 
 # Stage definitions: (status_key, progress_percent, display_label, icon)
 CLASSIFICATION_STAGES = [
@@ -16,41 +20,237 @@ CLASSIFICATION_STAGES = [
     ("failed",           100, "Classification failed",       "fa5s.times-circle"),
 ]
 STAGE_MAP = {s[0]: (s[1], s[2], s[3]) for s in CLASSIFICATION_STAGES}
+STAGE_ICON_COLOR = '#27ae60'
+STAGE_ICON_SIZE = 18
 
+# The native Windows file dialog can block the UI for seconds while it
+# enumerates network drives; DOCUSEC_FAST_DIALOG=1 uses Qt's own dialog there.
+FILE_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseNativeDialog
+    if sys.platform == 'win32' and os.environ.get('DOCUSEC_FAST_DIALOG')
+    else QFileDialog.Option(0)
+)
 
-class UploadWorker(QThread):
-    """Worker thread for file upload."""
+
+def _set_style_state(widget, state: str):
+    """Switch a widget's "state" property and re-apply its stylesheet rules.
+
+    The upload view's rules live in assets/style.qss under #UploadView and
+    select widgets by objectName or a "role"/"state" property.
+    """
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class UploadSignals(QObject):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
+
+class UploadWorker(QRunnable):
+    """File upload task, run on the shared QThreadPool.
+
+    QRunnable cannot emit signals itself, so results go through `signals`.
+    """
+
     def __init__(self, api_client, file_path):
         super().__init__()
         self.api_client = api_client
         self.file_path = file_path
+        self.signals = UploadSignals()
+        self.setAutoDelete(False)  # The view holds the reference
 
     def run(self):
         try:
             result = self.api_client.upload_file(self.file_path)
             if result:
-                self.finished.emit(result)
+                self.signals.finished.emit(result)
             else:
-                self.error.emit("Upload failed: Unknown error")
+                self.signals.error.emit("Upload failed: Unknown error")
         except Exception as e:
-            self.error.emit(f"Upload failed: {str(e)}")
+            self.signals.error.emit(f"Upload failed: {str(e)}")
 
 
 class PollWorker(QThread):
-    """Worker thread for polling classification status."""
+    """Long-lived worker thread that polls classification status until stopped.
+
+    Each request is a long-poll held server-side until the stage changes. For
+    servers that answer without holding, requests are paced by an interval
+    that backs off from 1s to 10s (x1.8, ±20% jitter) while the stage is
+    unchanged; the worker sleeps on a QWaitCondition between requests so
+    stop()/set_interval() take effect immediately.
+
+    Requests go through APIClient (not QNetworkAccessManager) because the
+    login session cookie lives in the client's requests.Session.
+    """
     result = pyqtSignal(object)
 
+    # Kept short: a held request can't be interrupted, so this bounds how
+    # long stop_status_workers() blocks on quit
+    LONG_POLL_WAIT_SECONDS = 5
+    MIN_INTERVAL_MS = 1000
+    MAX_INTERVAL_MS = 10000
+
     def __init__(self, api_client, doc_id):
         super().__init__()
         self.api_client = api_client
         self.doc_id = doc_id
+        self._mutex = QMutex()
+        self._cond = QWaitCondition()
+        self._stopped = False
+        self._interval_ms = self.MIN_INTERVAL_MS
+
+    def set_interval(self, ms: int):
+        self._mutex.lock()
+        self._interval_ms = ms
+        self._cond.wakeAll()
+        self._mutex.unlock()
+
+    def stop(self):
+        self._mutex.lock()
+        self._stopped = True
+        self._cond.wakeAll()
+        self._mutex.unlock()
+
+    def run(self):
+        since = None
+        etag = None
+        while not self._stopped:
+            started = time.monotonic()
+            status_data = self.api_client.get_classification_status(
+                self.doc_id, wait_seconds=self.LONG_POLL_WAIT_SECONDS, since=since, etag=etag)
+            if self._stopped:
+                return
+
+            status = status_data.get("status") if status_data else None
+            self._mutex.lock()
+            if status and status not in ("rate_limited", "not_modified") and status != since:
+                since = status
+                etag = status_data.get("etag")
+                self._interval_ms = self.MIN_INTERVAL_MS
+            else:
+                # Same stage, network hiccup or 429 — back off
+                self._interval_ms = min(
+                    int(self._interval_ms * 1.8 * random.uniform(0.8, 1.2)),
+                    self.MAX_INTERVAL_MS,
+                )
+            self._mutex.unlock()
+
+            self.result.emit(status_data)
+            if status in ("completed", "failed"):
+                return
+
+            self._mutex.lock()
+            interval_ms = self._interval_ms
+            if status == "rate_limited":
+                interval_ms = max(interval_ms, 3000)
+            # A request that was held server-side counts towards the interval
+            delay_ms = interval_ms - int((time.monotonic() - started) * 1000)
+            if not self._stopped and delay_ms > 0:
+                self._cond.wait(self._mutex, delay_ms)
+            self._mutex.unlock()
+
+
+class StatusStreamWorker(QThread):
+    """Worker thread that follows the server's classification status stream.
+
+    Emits `status` for every pushed stage change. Reconnects with the last seen
+    event id if the stream drops or ends without a final status; emits
+    `unavailable` if the stream cannot be used at all (or keeps dropping) so
+    the view can fall back to polling, and `timed_out` once `deadline`
+    (a time.monotonic() value) passes without a final status.
+    """
+    status = pyqtSignal(dict)
+    unavailable = pyqtSignal()
+    timed_out = pyqtSignal()
+
+    MAX_RECONNECTS = 3
+
+    def __init__(self, api_client, doc_id, deadline: float):
+        super().__init__()
+        self.api_client = api_client
+        self.doc_id = doc_id
+        self.deadline = deadline
+        self._stopped = False
+        self._response = None
+
+    def stop(self):
+        """Stop following the stream, interrupting a read in progress."""
+        self._stopped = True
+        response = self._response
+        if response is not None:
+            self.api_client.abort_stream(response)
+
+    def _on_stream_open(self, response):
+        self._response = response
+        if self._stopped:
+            # stop() ran before the response existed
+            self.api_client.abort_stream(response)
 
     def run(self):
-        status_data = self.api_client.get_classification_status(self.doc_id)
-        self.result.emit(status_data)
+        last_event_id = None
+        failures = 0
+        while not self._stopped:
+            if time.monotonic() > self.deadline:
+                self.timed_out.emit()
+                return
+            try:
+                for event_id, data in self.api_client.stream_classification_status(
+                        self.doc_id, last_event_id, on_open=self._on_stream_open):
+                    if self._stopped:
+                        return
+                    last_event_id = event_id or last_event_id
+                    failures = 0
+                    self.status.emit(data)
+                    if data.get("status") in ("completed", "failed"):
+                        return
+            except Exception:
+                if self._stopped:
+                    return
+                if last_event_id is None:
+                    # Never got an event: no stream endpoint
+                    self.unavailable.emit()
+                    return
+            finally:
+                self._response = None
+            # Dropped, or closed by the server without a final status
+            failures += 1
+            if failures > self.MAX_RECONNECTS:
+                if not self._stopped:
+                    self.unavailable.emit()
+                return
+            self.msleep(1000)
+
+
+# Status workers are not parented to a view: one that is stopped mid-request
+# only exits once the request returns, and may outlive its view (logout drops
+# the whole window). They stay referenced here until they finish.
+_status_workers = set()
+
+
+def _track_status_worker(worker: QThread):
+    _status_workers.add(worker)
+
+    def release():
+        worker.wait()  # finished is emitted just before the thread exits
+        _status_workers.discard(worker)
+
+    worker.finished.connect(release)
+
+
+def stop_status_workers():
+    """Stop every running status worker and wait for it to exit.
+
+    Connected to QApplication.aboutToQuit, so no QThread is still running
+    when the application tears its objects down.
+    """
+    workers = list(_status_workers)
+    for worker in workers:
+        worker.stop()
+    for worker in workers:
+        worker.wait()
+    _status_workers.clear()
 
 
 class DropZone(QFrame):
@@ -59,20 +259,14 @@ class DropZone(QFrame):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("dropZone")
         self.setAcceptDrops(True)
         self._hovered = False
-        self._apply_style()
 
     def _apply_style(self):
-        border_color = "#27ae60" if self._hovered else "#d1d5db"
-        bg = "#f0fdf4" if self._hovered else "#f9fafb"
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg};
-                border: 2px dashed {border_color};
-                border-radius: 12px;
-            }}
-        """)
+        self.setProperty("hovered", self._hovered)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
@@ -99,24 +293,38 @@ class DropZone(QFrame):
 
 
 class UploadDocumentView(QWidget):
-    MAX_POLL_COUNT = 300
+    MAX_POLL_SECONDS = 300
+    UI_UPDATE_INTERVAL_MS = 16  # Apply at most one status result per frame
 
     def __init__(self, api_client: APIClient):
         super().__init__()
         self.api_client = api_client
         self.selected_file_path = None
-        self.poll_timer = None
+        # Display name/size of the selected file, captured once on selection
+        self._basename = None
+        self._filesize = 0
         self.current_doc_id = None
-        self.poll_count = 0
-        self._poll_in_flight = False
+        self._poll_deadline = 0.0
+        # What the stage row currently shows, so unchanged results skip repaints
+        self._last_stage_icon = None
+        self._last_label = None
+        self._last_progress = 0
+        self._pending_status = None
+        self._ui_update_scheduled = False
         self._poll_worker = None
+        self._stream_worker = None
         self.setup_ui()
+        # Render the stage icons up front so the first transitions don't have to
+        for _, _, _, icon_name in CLASSIFICATION_STAGES:
+            cached_pixmap(icon_name, STAGE_ICON_COLOR, STAGE_ICON_SIZE)
 
     def setup_ui(self):
+        self.setObjectName("UploadView")  # Styled by the #UploadView rules in style.qss
+
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        scroll.setObjectName("uploadScroll")
 
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -125,30 +333,24 @@ class UploadDocumentView(QWidget):
 
         # Page title
         title = QLabel("Upload Document")
-        title.setStyleSheet("font-size: 28px; font-weight: bold; color: #1f2937;")
+        title.setProperty("role", "title")
         layout.addWidget(title)
 
         description = QLabel("Upload a document and the system will automatically classify "
                              "it using AI and store it securely.")
-        description.setStyleSheet("font-size: 14px; color: #6b7280; margin-bottom: 4px;")
+        description.setProperty("role", "description")
         description.setWordWrap(True)
         layout.addWidget(description)
 
         # ── Drop Zone Card ──
         drop_card = QFrame()
-        drop_card.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-            }
-        """)
+        drop_card.setProperty("role", "card")
         drop_card_layout = QVBoxLayout(drop_card)
         drop_card_layout.setContentsMargins(20, 20, 20, 20)
         drop_card_layout.setSpacing(16)
 
         card_title = QLabel("Select File")
-        card_title.setStyleSheet("font-size: 16px; font-weight: 600; color: #1f2937; border: none;")
+        card_title.setProperty("role", "cardTitle")
         drop_card_layout.addWidget(card_title)
 
         # Drop zone
@@ -160,19 +362,18 @@ class UploadDocumentView(QWidget):
         dz_layout.setSpacing(10)
 
         icon_label = QLabel()
-        icon_label.setPixmap(qta.icon('fa5s.cloud-upload-alt', color='#9ca3af').pixmap(48, 48))
+        icon_label.setPixmap(cached_pixmap('fa5s.cloud-upload-alt', '#9ca3af', 48))
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_label.setStyleSheet("border: none;")
         dz_layout.addWidget(icon_label)
 
         dz_text = QLabel("Drag & drop your file here")
         dz_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dz_text.setStyleSheet("font-size: 15px; font-weight: 500; color: #374151; border: none;")
+        dz_text.setProperty("role", "dropText")
         dz_layout.addWidget(dz_text)
 
         dz_sub = QLabel("or click the button below to browse")
         dz_sub.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        dz_sub.setStyleSheet("font-size: 13px; color: #9ca3af; border: none;")
+        dz_sub.setProperty("role", "dropSubtext")
         dz_layout.addWidget(dz_sub)
 
         drop_card_layout.addWidget(self.drop_zone)
@@ -182,20 +383,14 @@ class UploadDocumentView(QWidget):
         browse_row.setSpacing(12)
 
         self.browse_btn = QPushButton("  Browse Files")
-        self.browse_btn.setIcon(qta.icon('fa5s.folder-open', color='white'))
+        self.browse_btn.setIcon(cached_icon('fa5s.folder-open', 'white'))
         self.browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60; color: white; border: none;
-                border-radius: 8px; padding: 10px 20px; font-size: 14px; font-weight: 600;
-            }
-            QPushButton:hover { background-color: #229954; }
-        """)
+        self.browse_btn.setObjectName("browseButton")
         self.browse_btn.clicked.connect(self.select_file)
         browse_row.addWidget(self.browse_btn)
 
         format_label = QLabel("Supported: PDF, DOCX, TXT")
-        format_label.setStyleSheet("font-size: 12px; color: #9ca3af; border: none;")
+        format_label.setProperty("role", "hint")
         browse_row.addWidget(format_label)
         browse_row.addStretch()
 
@@ -203,38 +398,28 @@ class UploadDocumentView(QWidget):
 
         # Selected file info (hidden initially)
         self.file_info_frame = QFrame()
-        self.file_info_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f0fdf4;
-                border: 1px solid #bbf7d0;
-                border-radius: 8px;
-            }
-        """)
+        self.file_info_frame.setObjectName("fileInfo")
         self.file_info_frame.setVisible(False)
         fi_layout = QHBoxLayout(self.file_info_frame)
         fi_layout.setContentsMargins(12, 10, 12, 10)
 
         fi_icon = QLabel()
-        fi_icon.setPixmap(qta.icon('fa5s.file-alt', color='#27ae60').pixmap(20, 20))
-        fi_icon.setStyleSheet("border: none;")
+        fi_icon.setPixmap(cached_pixmap('fa5s.file-alt', '#27ae60', 20))
         fi_layout.addWidget(fi_icon)
 
         self.file_name_label = QLabel("")
-        self.file_name_label.setStyleSheet("font-size: 13px; font-weight: 500; color: #166534; border: none;")
+        self.file_name_label.setProperty("role", "fileName")
         fi_layout.addWidget(self.file_name_label)
 
         self.file_size_label = QLabel("")
-        self.file_size_label.setStyleSheet("font-size: 12px; color: #6b7280; border: none;")
+        self.file_size_label.setProperty("role", "fileSize")
         fi_layout.addWidget(self.file_size_label)
         fi_layout.addStretch()
 
         clear_btn = QPushButton("✕")
         clear_btn.setFixedSize(24, 24)
         clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        clear_btn.setStyleSheet("""
-            QPushButton { background: transparent; border: none; color: #6b7280; font-size: 14px; border-radius: 12px; }
-            QPushButton:hover { background-color: #dcfce7; color: #166534; }
-        """)
+        clear_btn.setObjectName("clearFileButton")
         clear_btn.clicked.connect(self._clear_file)
         fi_layout.addWidget(clear_btn)
 
@@ -243,20 +428,14 @@ class UploadDocumentView(QWidget):
 
         # ── Progress Card (hidden initially) ──
         self.progress_card = QFrame()
-        self.progress_card.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 12px;
-            }
-        """)
+        self.progress_card.setProperty("role", "card")
         self.progress_card.setVisible(False)
         pc_layout = QVBoxLayout(self.progress_card)
         pc_layout.setContentsMargins(20, 20, 20, 20)
         pc_layout.setSpacing(12)
 
         pc_title = QLabel("Processing Document")
-        pc_title.setStyleSheet("font-size: 16px; font-weight: 600; color: #1f2937; border: none;")
+        pc_title.setProperty("role", "cardTitle")
         pc_layout.addWidget(pc_title)
 
         self.progress_bar = QProgressBar()
@@ -264,30 +443,18 @@ class UploadDocumentView(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(8)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #e5e7eb;
-                border: none;
-                border-radius: 4px;
-            }
-            QProgressBar::chunk {
-                background-color: #27ae60;
-                border-radius: 4px;
-            }
-        """)
         pc_layout.addWidget(self.progress_bar)
 
         stage_row = QHBoxLayout()
         self.stage_icon = QLabel()
-        self.stage_icon.setStyleSheet("border: none;")
         self.stage_icon.setFixedSize(20, 20)
         stage_row.addWidget(self.stage_icon)
         self.stage_label = QLabel("")
-        self.stage_label.setStyleSheet("font-size: 13px; color: #6b7280; border: none;")
+        self.stage_label.setProperty("role", "stage")
         stage_row.addWidget(self.stage_label)
         stage_row.addStretch()
         self.progress_pct = QLabel("0%")
-        self.progress_pct.setStyleSheet("font-size: 13px; font-weight: 600; color: #27ae60; border: none;")
+        self.progress_pct.setProperty("role", "percent")
         stage_row.addWidget(self.progress_pct)
         pc_layout.addLayout(stage_row)
 
@@ -295,18 +462,10 @@ class UploadDocumentView(QWidget):
 
         # ── Upload Button ──
         self.upload_button = QPushButton("  Upload & Classify")
-        self.upload_button.setIcon(qta.icon('fa5s.cloud-upload-alt', color='white'))
+        self.upload_button.setIcon(cached_icon('fa5s.cloud-upload-alt', 'white'))
         self.upload_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.upload_button.setEnabled(False)
-        self.upload_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60; color: white; border: none;
-                border-radius: 10px; padding: 14px 28px; font-size: 16px; font-weight: bold;
-            }
-            QPushButton:hover { background-color: #229954; }
-            QPushButton:pressed { background-color: #1e8449; }
-            QPushButton:disabled { background-color: #d1d5db; color: #9ca3af; }
-        """)
+        self.upload_button.setObjectName("uploadButton")
         self.upload_button.clicked.connect(self.upload_file)
         layout.addWidget(self.upload_button)
 
@@ -319,24 +478,31 @@ class UploadDocumentView(QWidget):
     # ── File Selection ──
 
     def select_file(self):
-        path, _ = QFileDialog.getOpenFileName(
+        # open() instead of the static getOpenFileName: the event loop keeps
+        # running (and status updates keep arriving) while the dialog is up.
+        dialog = QFileDialog(
             self, "Select Document to Upload", "",
             "Supported Documents (*.pdf *.docx *.txt);;PDF Files (*.pdf);;Word Documents (*.docx);;Text Files (*.txt)"
         )
-        if path:
-            self._on_file_selected(path)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setOptions(FILE_DIALOG_OPTIONS | QFileDialog.Option.ReadOnly)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_file_selected)
+        dialog.open()
 
     def _on_file_selected(self, path: str):
         self.selected_file_path = path
-        name = os.path.basename(path)
-        size = os.path.getsize(path)
-        self.file_name_label.setText(name)
-        self.file_size_label.setText(self._format_size(size))
+        self._basename = os.path.basename(path)
+        self._filesize = os.path.getsize(path)
+        self.file_name_label.setText(self._basename)
+        self.file_size_label.setText(self._format_size(self._filesize))
         self.file_info_frame.setVisible(True)
         self.upload_button.setEnabled(True)
 
     def _clear_file(self):
         self.selected_file_path = None
+        self._basename = None
+        self._filesize = 0
         self.file_info_frame.setVisible(False)
         self.upload_button.setEnabled(False)
 
@@ -356,15 +522,7 @@ class UploadDocumentView(QWidget):
             QMessageBox.warning(self, "No File Selected", "Please select a file first.")
             return
 
-        if self.poll_timer and self.poll_timer.isActive():
-            self.poll_timer.stop()
-        if self._poll_worker is not None:
-            if self._poll_worker.isRunning():
-                self._poll_worker.quit()
-                self._poll_worker.wait(500)
-            self._poll_worker.deleteLater()
-            self._poll_worker = None
-        self._poll_in_flight = False
+        self._stop_status_updates()
         self.current_doc_id = None
 
         self.upload_button.setEnabled(False)
@@ -373,72 +531,117 @@ class UploadDocumentView(QWidget):
         self._set_stage("fa5s.cloud-upload-alt", "Uploading file...", 5)
 
         self.upload_worker = UploadWorker(self.api_client, self.selected_file_path)
-        self.upload_worker.finished.connect(self.on_upload_finished)
-        self.upload_worker.error.connect(self.on_upload_error)
-        self.upload_worker.start()
+        self.upload_worker.signals.finished.connect(self.on_upload_finished)
+        self.upload_worker.signals.error.connect(self.on_upload_error)
+        QThreadPool.globalInstance().start(self.upload_worker)
 
     def _set_stage(self, icon_name: str, text: str, pct: int):
-        self.stage_icon.setPixmap(qta.icon(icon_name, color='#27ae60').pixmap(18, 18))
-        self.stage_label.setText(text)
-        self.progress_bar.setValue(pct)
-        self.progress_pct.setText(f"{pct}%")
+        if icon_name != self._last_stage_icon:
+            self.stage_icon.setPixmap(cached_pixmap(icon_name, STAGE_ICON_COLOR, STAGE_ICON_SIZE))
+            self._last_stage_icon = icon_name
+        if text != self._last_label:
+            self.stage_label.setText(text)
+            self._last_label = text
+        if pct != self._last_progress:
+            self.progress_bar.setValue(pct)
+            self.progress_pct.setText(f"{pct}%")
+            self._last_progress = pct
 
     def on_upload_finished(self, result):
         self.current_doc_id = result.get("id")
         self._set_stage("fa5s.clock", "Queued for classification...", 10)
-
-        self.poll_count = 0
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self.poll_classification_status)
-        self.poll_timer.start(1000)
-
-    def poll_classification_status(self):
-        self.poll_count += 1
-        if self.poll_count > self.MAX_POLL_COUNT:
-            self.poll_timer.stop()
-            self.on_upload_error(
-                "Classification timed out after 5 minutes. "
-                "The document was saved but classification may still be in progress. "
-                "Check the document status in 'My Documents'."
-            )
+        self._start_status_updates()
+
+    # ── Classification Status ──
+
+    def _start_status_updates(self):
+        """Follow classification progress via the server's event stream."""
+        self._stop_status_updates()
+        # One deadline covers the stream and any polling fallback after it
+        self._poll_deadline = time.monotonic() + self.MAX_POLL_SECONDS
+        self._stream_worker = StatusStreamWorker(
+            self.api_client, self.current_doc_id, self._poll_deadline)
+        _track_status_worker(self._stream_worker)
+        self._stream_worker.status.connect(self._handle_poll_result)
+        self._stream_worker.unavailable.connect(self._start_polling)
+        self._stream_worker.timed_out.connect(self._on_status_timeout)
+        self._stream_worker.start()
+
+    def _start_polling(self):
+        """Fallback for servers without the status stream: one PollWorker
+        long-polls until the classification finishes."""
+        if self.current_doc_id is None:
             return
-
-        if self._poll_in_flight:
-            return
-        self._poll_in_flight = True
-
-        if self._poll_worker is not None:
-            self._poll_worker.deleteLater()
-
         self._poll_worker = PollWorker(self.api_client, self.current_doc_id)
-        self._poll_worker.result.connect(self._handle_poll_result)
+        _track_status_worker(self._poll_worker)
+        self._poll_worker.result.connect(self._on_poll_result)
         self._poll_worker.start()
 
-    def _handle_poll_result(self, status_data):
-        self._poll_in_flight = False
-        if not status_data:
+    def _stop_status_updates(self):
+        # Workers exit on their own once stopped; _status_workers keeps them
+        # alive until then
+        if self._stream_worker is not None:
+            self._stream_worker.stop()  # Interrupts the read
+            self._stream_worker.status.disconnect()
+            self._stream_worker.unavailable.disconnect()
+            self._stream_worker.timed_out.disconnect()
+            self._stream_worker = None
+        if self._poll_worker is not None:
+            self._poll_worker.stop()
+            self._poll_worker.result.disconnect()
+            self._poll_worker = None
+        self._pending_status = None
+
+    def _on_poll_result(self, status_data):
+        if time.monotonic() > self._poll_deadline:
+            self._on_status_timeout()
             return
+        self._handle_poll_result(status_data)
 
-        status = status_data.get("status", "queued")
+    def _on_status_timeout(self):
+        self.on_upload_error(
+            "Classification timed out after 5 minutes. "
+            "The document was saved but classification may still be in progress. "
+            "Check the document status in 'My Documents'."
+        )
 
-        if status == "rate_limited":
-            self.poll_timer.setInterval(3000)
+    def _handle_poll_result(self, status_data):
+        """Queue a status result; results arriving within one frame are applied once."""
+        if not status_data or status_data.get("status") in ("rate_limited", "not_modified"):
             return
+        self._pending_status = status_data
+        if not self._ui_update_scheduled:
+            self._ui_update_scheduled = True
+            QTimer.singleShot(self.UI_UPDATE_INTERVAL_MS, self._apply_pending_status)
+
+    def _apply_pending_status(self):
+        self._ui_update_scheduled = False
+        status_data = self._pending_status
+        if status_data is None:
+            return  # Status updates were stopped after it was queued
+
+        if not self.isVisible():
+            # Another page is showing: keep the latest result for showEvent
+            # instead of painting (or popping a dialog) off-screen. A finished
+            # classification still stops the background updates now.
+            if status_data.get("status") in ("completed", "failed"):
+                self._stop_status_updates()
+                self._pending_status = status_data
+            return
+        self._pending_status = None
 
-        if self.poll_timer.interval() != 1000:
-            self.poll_timer.setInterval(1000)
-
+        status = status_data.get("status", "queued")
         progress, label, icon = STAGE_MAP.get(status, (10, "Processing...", "fa5s.spinner"))
         self._set_stage(icon, label, progress)
 
         if status == "completed":
-            self.poll_timer.stop()
+            self._stop_status_updates()
             self._show_success({
-                "filename": os.path.basename(self.selected_file_path) if self.selected_file_path else "Document",
+                "filename": self._basename or "Document",
                 "classification": status_data.get("classification", "unclassified"),
             })
         elif status == "failed":
-            self.poll_timer.stop()
+            self._stop_status_updates()
             error_msg = status_data.get("error", "Classification failed")
             self.on_upload_error(f"Classification failed: {error_msg}")
 
@@ -453,73 +656,89 @@ class UploadDocumentView(QWidget):
         # Show inline success
         self._set_stage("fa5s.check-circle", "Classification complete", 100)
         self.progress_card.setVisible(True)
-        self.stage_label.setStyleSheet("font-size: 13px; color: #166534; font-weight: 600; border: none;")
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { background-color: #e5e7eb; border: none; border-radius: 4px; }
-            QProgressBar::chunk { background-color: #22c55e; border-radius: 4px; }
-        """)
-
-        QMessageBox.information(
-            self, "Upload Successful",
+        _set_style_state(self.stage_label, "success")
+        _set_style_state(self.progress_bar, "success")
+
+        box = self._open_message(
+            QMessageBox.Icon.Information, "Upload Successful",
             f"Document '{filename}' has been uploaded successfully!\n\n"
             f"Classification: {classification}\n\n"
             f"The document is now available in your 'My Documents' section."
         )
+        box.finished.connect(self._on_success_acknowledged)
 
-        # Reset
+    def _on_success_acknowledged(self):
         self._clear_file()
         self.current_doc_id = None
         self.progress_card.setVisible(False)
-        self.stage_label.setStyleSheet("font-size: 13px; color: #6b7280; border: none;")
-        self.progress_bar.setStyleSheet("""
-            QProgressBar { background-color: #e5e7eb; border: none; border-radius: 4px; }
-            QProgressBar::chunk { background-color: #27ae60; border-radius: 4px; }
-        """)
+        _set_style_state(self.stage_label, "")
+        _set_style_state(self.progress_bar, "")
 
     def on_upload_error(self, error_message):
-        if self.poll_timer:
-            self.poll_timer.stop()
+        self._stop_status_updates()
         self.progress_card.setVisible(False)
         self.upload_button.setEnabled(True)
         self.browse_btn.setEnabled(True)
 
-        if self.current_doc_id:
-            retry = QMessageBox.question(
-                self, "Retry Classification?",
-                "The document was saved but classification failed.\n"
-                "Would you like to retry classification?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            )
-            if retry == QMessageBox.StandardButton.Yes:
-                try:
-                    self.api_client.retry_classification(self.current_doc_id)
-                    self.poll_count = 0
-                    self._poll_in_flight = False
-                    self.progress_card.setVisible(True)
-                    self._set_stage("fa5s.redo", "Retrying classification...", 10)
-                    self.upload_button.setEnabled(False)
-                    self.browse_btn.setEnabled(False)
-                    self.poll_timer = QTimer()
-                    self.poll_timer.timeout.connect(self.poll_classification_status)
-                    self.poll_timer.start(1000)
-                    return
-                except Exception:
-                    QMessageBox.critical(self, "Retry Failed", "Could not retry classification.")
+        if not self.current_doc_id:
+            self._open_message(QMessageBox.Icon.Critical, "Upload Failed", error_message)
+            return
+
+        box = self._open_message(
+            QMessageBox.Icon.Question, "Retry Classification?",
+            "The document was saved but classification failed.\n"
+            "Would you like to retry classification?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        box.finished.connect(lambda answer: self._on_retry_answered(answer, error_message))
+
+    def _on_retry_answered(self, answer: int, error_message: str):
+        if answer == QMessageBox.StandardButton.Yes.value:
+            try:
+                self.api_client.retry_classification(self.current_doc_id)
+                self.progress_card.setVisible(True)
+                self._set_stage("fa5s.redo", "Retrying classification...", 10)
+                self.upload_button.setEnabled(False)
+                self.browse_btn.setEnabled(False)
+                self._start_status_updates()
+                return
+            except Exception:
+                self.current_doc_id = None
+                box = self._open_message(QMessageBox.Icon.Critical, "Retry Failed",
+                                         "Could not retry classification.")
+                box.finished.connect(lambda: self._open_message(
+                    QMessageBox.Icon.Critical, "Upload Failed", error_message))
+                return
 
         self.current_doc_id = None
-        QMessageBox.critical(self, "Upload Failed", error_message)
+        self._open_message(QMessageBox.Icon.Critical, "Upload Failed", error_message)
+
+    def _open_message(self, icon, title: str, text: str,
+                      buttons=QMessageBox.StandardButton.Ok) -> QMessageBox:
+        """Show a window-modal message box without blocking the event loop.
+
+        Unlike the static QMessageBox helpers, open() returns immediately, so
+        status results and timers keep being processed while it is showing.
+        """
+        box = QMessageBox(icon, title, text, buttons, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+        return box
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_status is not None and not self._ui_update_scheduled:
+            self._ui_update_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_status)
 
     def refresh_data(self):
         """No-op — nothing to refresh, but keeps interface consistent."""
         pass
 
+    def stop_status_updates(self):
+        """Stop following classification progress, e.g. when the window closes."""
+        self._stop_status_updates()
+
     def closeEvent(self, event):
-        if self.poll_timer and self.poll_timer.isActive():
-            self.poll_timer.stop()
-        if self._poll_worker is not None:
-            if self._poll_worker.isRunning():
-                self._poll_worker.quit()
-                self._poll_worker.wait(1000)
-            self._poll_worker.deleteLater()
-            self._poll_worker = None
+        self.stop_status_updates()
         super().closeEvent(event)
@@ -1,153 +1,367 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QLineEdit, QMessageBox, QComboBox, QFrame, QScrollArea, 
-                             QTableWidget, QTableWidgetItem, QDialog, QDialogButtonBox, 
-                             QGroupBox, QHeaderView, QMenu, QTabWidget, QInputDialog)
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QColor
-import qtawesome as qta
+                             QTableWidget, QTableWidgetItem, QTableView, QDialog, QDialogButtonBox, 
+                             QGroupBox, QHeaderView, QMenu, QTabWidget, QInputDialog,
+                             QStyledItemDelegate, QStyle)
+from PyQt6.QtCore import (Qt, QSize, QAbstractTableModel, QModelIndex, QEvent, QPoint,
+                          QRect, QTimer, pyqtSignal)
+from PyQt6.QtGui import QColor, QFont, QPainter
+from typing import Optional
 from api.client import APIClient
+from utils.icon_cache import cached_icon, cached_pixmap
+from utils.validators import EMAIL_RE
 from views.admin_user_management_view import AdminUserManagementView
+from workers.api_worker import run_api_call
 
+# Text colors shared by the users model and the departments table; QColor
+# parses its hex string on construction, so cells reuse these instances.
+TEXT_COLOR = QColor('#1f2937')
+MUTED_TEXT_COLOR = QColor('#6b7280')
 
-class UserActionMenuButton(QPushButton):
-    """Custom button that shows a dropdown menu with user actions"""
-    
-    def __init__(self, user_data: dict, parent_view, parent=None):
-        super().__init__(parent)
-        self.user_data = user_data
-        self.parent_view = parent_view
-        self.setup_ui()
-    
-    def setup_ui(self):
-        # Set icon - three vertical dots
-        self.setIcon(qta.icon('fa5s.ellipsis-v', color='#6b7280'))
-        self.setIconSize(QSize(18, 18))
-        self.setToolTip("More actions")
-        
-        # Style the button
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 18px;
-                padding: 8px 14px;
-                min-width: 40px;
-                max-width: 40px;
-                min-height: 40px;
-                max-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #f3f4f6;
-            }
-            QPushButton:pressed {
-                background-color: #e5e7eb;
-            }
-        """)
-        
-        # Connect to show menu
-        self.clicked.connect(self.show_menu)
-    
-    def show_menu(self):
-        """Show dropdown menu with available actions"""
-        menu = QMenu(self)
-        
-        # Style the menu
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 8px 20px 8px 40px;
-                border-radius: 4px;
-                margin: 2px 4px;
-            }
-            QMenu::item:selected {
-                background-color: #f3f4f6;
-            }
-            QMenu::icon {
-                left: 12px;
-            }
-        """)
-        
-        # Add Edit action
-        edit_action = menu.addAction(
-            qta.icon('fa5s.edit', color='#3b82f6'), 
-            "Edit User"
-        )
-        edit_action.triggered.connect(lambda: self.parent_view.edit_user(self.user_data))
-        
-        # Add separator
-        menu.addSeparator()
-        
-        # Add Delete action
-        delete_action = menu.addAction(
-            qta.icon('fa5s.trash-alt', color='#ef4444'), 
-            "Delete User"
-        )
-        delete_action.triggered.connect(lambda: self.parent_view.delete_user(self.user_data))
-        
-        # Show menu at button position
-        menu.exec(self.mapToGlobal(self.rect().bottomLeft()))
+# Shared stylesheets: parsed by Qt on every setStyleSheet call, so each one
+# is built once here and reused across widgets, rows and dialog openings.
+INPUT_STYLE = """
+    QLineEdit, QComboBox {
+        padding: 10px 15px;
+        border: 2px solid #d1d5db;
+        border-radius: 6px;
+        font-size: 14px;
+        background-color: white;
+        min-height: 20px;
+    }
+    QLineEdit:focus, QComboBox:focus {
+        border-color: #3498db;
+    }
+"""
 
+FIELD_LABEL_STYLE = "font-weight: bold; font-size: 13px;"
+
+GREEN_BTN_STYLE = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #229954;
+    }
+"""
+
+GHOST_BTN_STYLE = """
+    QPushButton {
+        background-color: #ffffff;
+        color: #374151;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #f9fafb;
+        border-color: #9ca3af;
+    }
+"""
+
+TABLE_STYLE = """
+    QTableView {
+        background-color: #ffffff;
+        border: 1px solid #e5e7eb;
+        border-radius: 8px;
+        gridline-color: transparent;
+    }
+    QTableView::item {
+        padding: 0px;
+        border-bottom: 1px solid #f3f4f6;
+    }
+    QTableView::item:selected {
+        background-color: #f9fafb;
+        color: #1f2937;
+    }
+    QHeaderView::section {
+        background-color: #f9fafb;
+        color: #6b7280;
+        padding: 12px 8px;
+        border: none;
+        border-bottom: 2px solid #e5e7eb;
+        font-weight: 600;
+        font-size: 12px;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+"""
+
+# Users table cells are painted by the model/delegates, so text is inset here
+USERS_TABLE_STYLE = TABLE_STYLE + """
+    QTableView::item {
+        padding-left: 12px;
+    }
+"""
+
+TAB_STYLE = """
+    QTabWidget::pane {
+        border: 1px solid #e5e7eb;
+        border-radius: 8px;
+        background: white;
+    }
+    QTabBar::tab {
+        padding: 10px 24px;
+        font-size: 14px;
+        font-weight: 500;
+        color: #6b7280;
+        border: none;
+        border-bottom: 2px solid transparent;
+        margin-right: 4px;
+    }
+    QTabBar::tab:selected {
+        color: #27ae60;
+        border-bottom: 2px solid #27ae60;
+    }
+    QTabBar::tab:hover:!selected {
+        color: #374151;
+    }
+"""
+
+MENU_STYLE = """
+    QMenu {
+        background-color: white;
+        border: 1px solid #e5e7eb;
+        border-radius: 8px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 8px 20px 8px 40px;
+        border-radius: 4px;
+        margin: 2px 4px;
+    }
+    QMenu::item:selected {
+        background-color: #f3f4f6;
+    }
+    QMenu::icon {
+        left: 12px;
+    }
+"""
+
+# Row buttons pick up their look from the table by object name instead of
+# each one carrying (and re-parsing) its own stylesheet
+DEPT_TABLE_STYLE = TABLE_STYLE + """
+    QPushButton#deptEditButton, QPushButton#deptDeleteButton {
+        background: transparent; border: none; border-radius: 6px;
+    }
+    QPushButton#deptEditButton:hover { background-color: #dbeafe; }
+    QPushButton#deptDeleteButton:hover { background-color: #fee2e2; }
+"""
+
+
+class RoleBadgeDelegate(QStyledItemDelegate):
+    """Paints the color-coded role pill for the Role column."""
 
-class RoleBadge(QWidget):
-    """Custom widget for role badges with color coding"""
-    
     ROLE_COLORS = {
-        'admin': ('#ef4444', '#fee2e2'),  # Red
-        'user': ('#3b82f6', '#dbeafe'),   # Blue
+        'admin': (QColor('#ef4444'), QColor('#fee2e2')),  # Red
+        'user': (QColor('#3b82f6'), QColor('#dbeafe')),   # Blue
     }
-    
-    def __init__(self, role: str, parent=None):
+    UNKNOWN_COLORS = (QColor('#6b7280'), QColor('#f3f4f6'))  # Gray
+    BADGE_HEIGHT = 26
+    H_PADDING = 14
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.role = role.lower()
-        self.setMinimumHeight(40)
-        self.setup_ui()
-    
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Get colors for role
-        text_color, bg_color = self.ROLE_COLORS.get(
-            self.role, 
-            ('#6b7280', '#f3f4f6')  # Gray for unknown
-        )
-        
-        # Create badge label
-        badge = QLabel(self.role.upper())
-        badge.setMinimumHeight(24)
-        badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {text_color};
-                border-radius: 10px;
-                padding: 6px 14px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-        """)
-        
-        layout.addWidget(badge)
-        layout.addStretch()
+        self._font = QFont()
+        self._font.setPixelSize(11)
+        self._font.setBold(True)
+
+    def paint(self, painter, option, index):
+        # Base paint draws only the background/selection: the column has no text
+        super().paint(painter, option, index)
+        user = index.data(UsersModel.UserDataRole) or {}
+        role = (user.get('role') or 'user').lower()
+        text_color, bg_color = self.ROLE_COLORS.get(role, self.UNKNOWN_COLORS)
+        label = role.upper()
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        width = painter.fontMetrics().horizontalAdvance(label) + 2 * self.H_PADDING
+        rect = QRect(option.rect.left(),
+                     option.rect.center().y() - self.BADGE_HEIGHT // 2,
+                     width, self.BADGE_HEIGHT)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(rect, 10, 10)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
+
+
+class ActionMenuDelegate(QStyledItemDelegate):
+    """Paints the "more actions" button and reports clicks on it."""
+
+    menu_requested = pyqtSignal(dict, QPoint)
+
+    BUTTON_SIZE = 36
+    ICON_SIZE = 18
+    HOVER_COLOR = QColor('#f3f4f6')
+
+    def __init__(self, view: QTableView):
+        super().__init__(view)
+        self._view = view
+
+    def _button_rect(self, cell: QRect) -> QRect:
+        rect = QRect(0, 0, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        rect.moveCenter(cell.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        button = self._button_rect(option.rect)
+
+        painter.save()
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.HOVER_COLOR)
+            painter.drawEllipse(button)
+        icon_rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+        icon_rect.moveCenter(button.center())
+        painter.drawPixmap(icon_rect, cached_pixmap('fa5s.ellipsis-v', '#6b7280', self.ICON_SIZE))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            button = self._button_rect(option.rect)
+            if button.contains(event.position().toPoint()):
+                user = index.data(UsersModel.UserDataRole)
+                anchor = self._view.viewport().mapToGlobal(button.bottomLeft())
+                self.menu_requested.emit(user, anchor)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class UsersModel(QAbstractTableModel):
+    """Table model over the user dicts returned by the API.
+
+    The view only asks for the cells it paints, so refreshing costs a model
+    reset instead of building items and widgets for every row.
+    """
+
+    HEADERS = ["Username", "Email", "Name", "Department", "Role", ""]
+    USERNAME, EMAIL, NAME, DEPARTMENT, ROLE, ACTIONS = range(6)
+    # Role under which every cell exposes its row's full user dict
+    UserDataRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+        self._dept_names = {}
+        self._username_font = QFont()
+        self._username_font.setPixelSize(14)
+        self._username_font.setWeight(QFont.Weight.DemiBold)
+
+    def set_users(self, users: list):
+        self.beginResetModel()
+        self._users = list(users)
+        self.endResetModel()
+
+    def set_departments(self, departments: list):
+        """Update the id -> name lookup used by the Department column."""
+        self._dept_names = {
+            dept.get('id'): dept.get('name', '')
+            for dept in departments
+            if isinstance(dept, dict)
+        }
+        if self._users:
+            self.dataChanged.emit(
+                self.index(0, self.DEPARTMENT),
+                self.index(len(self._users) - 1, self.DEPARTMENT),
+            )
+
+    def user_at(self, row: int) -> dict:
+        return self._users[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._users)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        user = self._users[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.USERNAME:
+                return user.get('username', '')
+            if column == self.EMAIL:
+                return user.get('email', '')
+            if column == self.NAME:
+                return f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
+            if column == self.DEPARTMENT:
+                return self._department_name(user)
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return TEXT_COLOR if column == self.USERNAME else MUTED_TEXT_COLOR
+        if role == Qt.ItemDataRole.DecorationRole and column == self.USERNAME:
+            return cached_icon('fa5s.user-circle', '#6b7280')
+        if role == Qt.ItemDataRole.FontRole and column == self.USERNAME:
+            return self._username_font
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignVCenter
+        if role == Qt.ItemDataRole.ToolTipRole and column == self.ACTIONS:
+            return "More actions"
+        if role == self.UserDataRole:
+            return user
+        return None
+
+    def _department_name(self, user: dict) -> str:
+        if isinstance(user.get('department'), dict):
+            return user.get('department', {}).get('name', 'None') or 'None'
+        if user.get('department_id') is not None:
+            return self._dept_names.get(user.get('department_id'), 'None') or 'None'
+        return 'None'
 
 
 class UserEditDialog(QDialog):
     """Dialog for editing user details."""
     
-    def __init__(self, api_client: APIClient, user_data: dict, parent=None):
+    ROLES = ["user", "admin"]
+    ROLE_INDEX = {role: i for i, role in enumerate(ROLES)}
+    
+    def __init__(self, api_client: APIClient, user_data: dict, parent=None,
+                 departments: Optional[list] = None):
         super().__init__(parent)
         self.api_client = api_client
-        self.user_data = user_data
         self.departments = []
-        self.setWindowTitle(f"Edit User: {user_data['username']}")
+        self._dept_index = {None: 0}  # department id -> combo index
+        self._saving = False
         self.setMinimumWidth(500)
         self.setModal(True)
         self.setup_ui()
-        self.load_departments()
+        self.set_user(user_data, departments)
+    
+    def set_user(self, user_data: dict, departments: Optional[list] = None):
+        """Point the form at `user_data`, so one dialog can serve repeated edits."""
+        self.user_data = user_data
+        self.setWindowTitle(f"Edit User: {user_data['username']}")
+        self.new_password_input.clear()
+        # Reuse the caller's department list (even an empty one) when given;
+        # fetch otherwise
+        if departments is not None:
+            if departments is not self.departments:
+                self._on_departments_loaded(departments)
+        elif not self.departments and self.dept_combo.isEnabled():
+            self.load_departments()
         self.load_user_data()
     
     def setup_ui(self):
@@ -161,81 +375,62 @@ class UserEditDialog(QDialog):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         
         content_widget = QWidget()
+        # One stylesheet for every input in the form, inherited by the children
+        content_widget.setStyleSheet(INPUT_STYLE)
         layout = QVBoxLayout(content_widget)
         layout.setSpacing(15)
         
-        # Input style
-        input_style = """
-            QLineEdit, QComboBox {
-                padding: 10px 15px;
-                border: 2px solid #d1d5db;
-                border-radius: 6px;
-                font-size: 14px;
-                background-color: white;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border-color: #3498db;
-            }
-        """
-        
         # Username
         username_label = QLabel("Username:")
-        username_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        username_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(username_label)
         
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Enter username")
-        self.username_input.setStyleSheet(input_style)
         layout.addWidget(self.username_input)
         
         # Email
         email_label = QLabel("Email:")
-        email_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        email_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(email_label)
         
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Enter email address")
-        self.email_input.setStyleSheet(input_style)
         layout.addWidget(self.email_input)
         
         # First Name
         fname_label = QLabel("First Name:")
-        fname_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        fname_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(fname_label)
         
         self.fname_input = QLineEdit()
         self.fname_input.setPlaceholderText("Enter first name")
-        self.fname_input.setStyleSheet(input_style)
         layout.addWidget(self.fname_input)
         
         # Last Name
         lname_label = QLabel("Last Name:")
-        lname_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        lname_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(lname_label)
         
         self.lname_input = QLineEdit()
         self.lname_input.setPlaceholderText("Enter last name")
-        self.lname_input.setStyleSheet(input_style)
         layout.addWidget(self.lname_input)
         
         # Department
         dept_label = QLabel("Department:")
-        dept_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        dept_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(dept_label)
         
         self.dept_combo = QComboBox()
-        self.dept_combo.setStyleSheet(input_style)
         layout.addWidget(self.dept_combo)
         
         # Role
         role_label = QLabel("Role:")
-        role_label.setStyleSheet("font-weight: bold; font-size: 13px;")
+        role_label.setStyleSheet(FIELD_LABEL_STYLE)
         layout.addWidget(role_label)
         
         self.role_combo = QComboBox()
-        self.role_combo.addItems(["user", "admin"])
-        self.role_combo.setStyleSheet(input_style)
+        self.role_combo.addItems(self.ROLES)
         layout.addWidget(self.role_combo)
         
         # Password Reset Section
@@ -259,7 +454,6 @@ class UserEditDialog(QDialog):
         self.new_password_input = QLineEdit()
         self.new_password_input.setPlaceholderText("New password (optional)")
         self.new_password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.new_password_input.setStyleSheet(input_style)
         password_layout.addWidget(self.new_password_input)
         
         password_group.setLayout(password_layout)
@@ -273,7 +467,7 @@ class UserEditDialog(QDialog):
         main_layout.addWidget(scroll)
         
         # Buttons
-        button_box = QDialogButtonBox(
+        self.button_box = button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Save | 
             QDialogButtonBox.StandardButton.Cancel
         )
@@ -314,12 +508,24 @@ class UserEditDialog(QDialog):
         main_layout.addWidget(button_box)
     
     def load_departments(self):
-        """Load departments into combo box."""
-        self.departments = self.api_client.get_departments()
+        """Fetch departments in the background and fill the combo box."""
         self.dept_combo.clear()
         self.dept_combo.addItem("None", None)
-        for dept in self.departments:
+        self.dept_combo.setEnabled(False)
+        run_api_call(self.api_client.get_departments,
+                     on_done=self._on_departments_loaded,
+                     on_error=lambda _message: self.dept_combo.setEnabled(True))
+    
+    def _on_departments_loaded(self, departments):
+        self.departments = departments or []
+        self.dept_combo.clear()
+        self.dept_combo.addItem("None", None)
+        self._dept_index = {None: 0}
+        for i, dept in enumerate(self.departments, start=1):
             self.dept_combo.addItem(dept['name'], dept['id'])
+            self._dept_index[dept['id']] = i
+        self.dept_combo.setEnabled(True)
+        self._select_user_department()
     
     def load_user_data(self):
         """Load user data into form."""
@@ -328,18 +534,15 @@ class UserEditDialog(QDialog):
         self.fname_input.setText(self.user_data.get('first_name', ''))
         self.lname_input.setText(self.user_data.get('last_name', ''))
         
-        # Set department
-        dept_id = self.user_data.get('department_id')
-        if dept_id:
-            index = self.dept_combo.findData(dept_id)
-            if index >= 0:
-                self.dept_combo.setCurrentIndex(index)
+        self._select_user_department()
         
         # Set role
         role = self.user_data.get('role', 'user')
-        index = self.role_combo.findText(role)
-        if index >= 0:
-            self.role_combo.setCurrentIndex(index)
+        self.role_combo.setCurrentIndex(self.ROLE_INDEX.get(role, 0))
+    
+    def _select_user_department(self):
+        dept_id = self.user_data.get('department_id')
+        self.dept_combo.setCurrentIndex(self._dept_index.get(dept_id, 0))
     
     def save_user(self):
         """Save user changes."""
@@ -357,45 +560,66 @@ class UserEditDialog(QDialog):
                               "Username, email, first name, and last name are required.")
             return
         
-        if '@' not in email or '.' not in email:
+        if not EMAIL_RE.match(email):
             QMessageBox.warning(self, "Validation Error", 
                               "Please enter a valid email address.")
             return
         
-        # Update user
-        user_id = self.user_data['id']
-        success, message = self.api_client.admin_update_user(
-            user_id, email, first_name, last_name, username, role, dept_id
-        )
+        # Checked up front so a short password never leaves a half-applied save
+        if new_password and len(new_password) < 6:
+            QMessageBox.warning(self, "Validation Error", 
+                              "Password must be at least 6 characters long.")
+            return
         
+        # Profile and password go in one request, applied in one commit server-side
+        self._set_saving(True)
+        run_api_call(self.api_client.admin_update_user, self.user_data['id'], email,
+                     first_name, last_name, username, role, dept_id, new_password or None,
+                     on_done=self._on_saved, on_error=self._on_save_error)
+    
+    def _on_saved(self, result):
+        self._set_saving(False)
+        success, message = result
         if not success:
             QMessageBox.critical(self, "Error", f"Failed to update user: {message}")
             return
         
-        # Reset password if provided
-        if new_password:
-            if len(new_password) < 6:
-                QMessageBox.warning(self, "Validation Error", 
-                                  "Password must be at least 6 characters long.")
-                return
-            
-            success, message = self.api_client.admin_reset_password(user_id, new_password)
-            if not success:
-                QMessageBox.warning(self, "Warning", 
-                                  f"User updated but password reset failed: {message}")
-        
         QMessageBox.information(self, "Success", "User updated successfully!")
         self.accept()
+    
+    def _on_save_error(self, message):
+        self._set_saving(False)
+        QMessageBox.critical(self, "Error", f"Failed to update user: {message}")
+    
+    def _set_saving(self, saving: bool):
+        self._saving = saving
+        self.button_box.setEnabled(not saving)
+    
+    def reject(self):
+        # Keep the dialog open until an in-flight save has reported back
+        if not self._saving:
+            super().reject()
 
 
 class UserManagementView(QWidget):
     """Admin view for managing all users."""
     
+    SEARCH_DEBOUNCE_MS = 250
+    
     def __init__(self, api_client: APIClient):
         super().__init__()
         self.api_client = api_client
         self.users = []
         self.departments = []
+        self._departments_loaded = False  # Tells "not loaded yet" from "none exist"
+        self._users_loading = False
+        self._users_reload_pending = False
+        self._departments_loading = False
+        self._departments_reload_pending = False
+        self._departments_refresh_scheduled = False
+        self._edit_dialog = None
+        self._user_menu = None
+        self._menu_user = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -434,29 +658,7 @@ class UserManagementView(QWidget):
 
         # Tab widget for Users / Departments
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                background: white;
-            }
-            QTabBar::tab {
-                padding: 10px 24px;
-                font-size: 14px;
-                font-weight: 500;
-                color: #6b7280;
-                border: none;
-                border-bottom: 2px solid transparent;
-                margin-right: 4px;
-            }
-            QTabBar::tab:selected {
-                color: #27ae60;
-                border-bottom: 2px solid #27ae60;
-            }
-            QTabBar::tab:hover:!selected {
-                color: #374151;
-            }
-        """)
+        self.tab_widget.setStyleSheet(TAB_STYLE)
         main_layout.addWidget(self.tab_widget)
 
         # ── Users Tab ──
@@ -466,16 +668,15 @@ class UserManagementView(QWidget):
         users_layout.setSpacing(12)
 
         self._setup_users_tab(users_layout)
-        self.tab_widget.addTab(users_tab, qta.icon('fa5s.users', color='#6b7280'), "Users")
+        self.tab_widget.addTab(users_tab, cached_icon('fa5s.users', '#6b7280'), "Users")
 
         # ── Departments Tab ──
-        dept_tab = QWidget()
-        dept_layout = QVBoxLayout(dept_tab)
-        dept_layout.setContentsMargins(0, 12, 0, 0)
-        dept_layout.setSpacing(12)
-
-        self._setup_departments_tab(dept_layout)
-        self.tab_widget.addTab(dept_tab, qta.icon('fa5s.building', color='#6b7280'), "Departments")
+        # Built on first selection; until then the tab is an empty placeholder
+        self._dept_tab = QWidget()
+        self._dept_built = False
+        self._dept_tab_index = self.tab_widget.addTab(
+            self._dept_tab, cached_icon('fa5s.building', '#6b7280'), "Departments")
+        self.tab_widget.currentChanged.connect(self._ensure_dept_tab)
 
         # Load initial data
         self.refresh_users()
@@ -504,66 +705,31 @@ class UserManagementView(QWidget):
                 border-color: #3b82f6;
             }
         """)
-        self.search_input.textChanged.connect(self.search_users)
+        # Live search: restart a single-shot timer per keystroke so one request
+        # goes out once typing settles
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.refresh_users)
+        self.search_input.textChanged.connect(self._search_timer.start)
         action_bar.addWidget(self.search_input)
         
         search_btn = QPushButton("Search")
-        search_btn.setIcon(qta.icon('fa5s.search', color='#374151'))
-        search_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff;
-                color: #374151;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #f9fafb;
-                border-color: #9ca3af;
-            }
-        """)
+        search_btn.setIcon(cached_icon('fa5s.search', '#374151'))
+        search_btn.setStyleSheet(GHOST_BTN_STYLE)
         search_btn.clicked.connect(self.refresh_users)
         action_bar.addWidget(search_btn)
         
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.setIcon(qta.icon('fa5s.sync-alt', color='#374151'))
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff;
-                color: #374151;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #f9fafb;
-                border-color: #9ca3af;
-            }
-        """)
+        refresh_btn.setIcon(cached_icon('fa5s.sync-alt', '#374151'))
+        refresh_btn.setStyleSheet(GHOST_BTN_STYLE)
         refresh_btn.clicked.connect(lambda: self.refresh_users(clear_search=True))
         action_bar.addWidget(refresh_btn)
         
         # Create User button (admin only)
         create_user_btn = QPushButton("Create User")
-        create_user_btn.setIcon(qta.icon('fa5s.user-plus', color="white"))
-        create_user_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        create_user_btn.setIcon(cached_icon('fa5s.user-plus', "white"))
+        create_user_btn.setStyleSheet(GREEN_BTN_STYLE)
         create_user_btn.clicked.connect(self.create_user)
         action_bar.addWidget(create_user_btn)
         
@@ -572,27 +738,32 @@ class UserManagementView(QWidget):
         layout.addLayout(action_bar)
         
         # Users table with modern styling
-        self.users_table = QTableWidget()
-        self.users_table.setColumnCount(6)
-        self.users_table.setHorizontalHeaderLabels([
-            "Username", "Email", "Name", "Department", "Role", ""
-        ])
+        self.users_model = UsersModel(self)
+        self.users_table = QTableView()
+        self.users_table.setModel(self.users_model)
+        self.users_table.setIconSize(QSize(24, 24))
+        self.users_table.setMouseTracking(True)
+        self.users_table.setItemDelegateForColumn(
+            UsersModel.ROLE, RoleBadgeDelegate(self.users_table))
+        self._action_delegate = ActionMenuDelegate(self.users_table)
+        self._action_delegate.menu_requested.connect(self.show_user_menu)
+        self.users_table.setItemDelegateForColumn(UsersModel.ACTIONS, self._action_delegate)
         
         # Hide row numbers
         vertical_header = self.users_table.verticalHeader()
-        if vertical_header:
+        if vertical_header is not None:
             vertical_header.setVisible(False)
         
         # Set table properties
-        self.users_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.users_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.users_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.users_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.users_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.users_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.users_table.setAlternatingRowColors(False)
         self.users_table.setShowGrid(False)
         
-        # Set fixed row height
+        # Fixed 60px rows; an empty QHeaderView is falsy, so test against None
         v_header = self.users_table.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             v_header.setDefaultSectionSize(60)
         
@@ -618,33 +789,7 @@ class UserManagementView(QWidget):
             self.users_table.setColumnWidth(5, 60)
         
         # Apply modern styling
-        self.users_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                gridline-color: transparent;
-            }
-            QTableWidget::item {
-                padding: 0px;
-                border-bottom: 1px solid #f3f4f6;
-            }
-            QTableWidget::item:selected {
-                background-color: #f9fafb;
-                color: #1f2937;
-            }
-            QHeaderView::section {
-                background-color: #f9fafb;
-                color: #6b7280;
-                padding: 12px 8px;
-                border: none;
-                border-bottom: 2px solid #e5e7eb;
-                font-weight: 600;
-                font-size: 12px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-        """)
+        self.users_table.setStyleSheet(USERS_TABLE_STYLE)
         
         layout.addWidget(self.users_table)
     
@@ -652,102 +797,83 @@ class UserManagementView(QWidget):
         """Refresh the users list."""
         if clear_search:
             self.search_input.clear()
+        # This refresh covers any pending keystrokes, including the clear above
+        self._search_timer.stop()
+        
+        # One request at a time; a refresh asked for meanwhile reruns with
+        # the latest search text once the current one reports back.
+        if self._users_loading:
+            self._users_reload_pending = True
+            return
+        self._users_loading = True
         
         search = self.search_input.text().strip() or None
-        self.users = self.api_client.get_users(search)
-        self.populate_table()
+        run_api_call(self.api_client.get_users, search,
+                     on_done=self._on_users_loaded, on_error=self._on_users_load_error)
     
-    def search_users(self):
-        """Search users as user types."""
-        # Debounce or search on demand
-        pass
+    def _on_users_loaded(self, users):
+        self._users_loading = False
+        if self._users_reload_pending:
+            self._users_reload_pending = False
+            self.refresh_users()
+            return
+        users = users or []
+        # An unchanged list (the common case for Refresh) keeps the current rows
+        # and selection rather than resetting the model
+        if users == self.users:
+            return
+        self.users = users
+        self.users_model.set_users(self.users)
     
-    def populate_table(self):
-        """Populate table with users."""
-        self.users_table.setRowCount(0)
-        dept_lookup = {
-            dept.get('id'): dept.get('name', '')
-            for dept in self.departments
-            if isinstance(dept, dict)
-        }
+    def _on_users_load_error(self, message):
+        self._users_loading = False
+        self._users_reload_pending = False
+        QMessageBox.critical(self, "Error", f"Failed to load users: {message}")
+    
+    def show_user_menu(self, user: dict, pos: QPoint):
+        """Show dropdown menu with the actions available for a user row."""
+        if self._user_menu is None:
+            self._user_menu = self._build_user_menu()
+        self._menu_user = user
+        self._user_menu.exec(pos)
+    
+    def _build_user_menu(self) -> QMenu:
+        """Create the row action menu once; show_user_menu retargets it per row."""
+        menu = QMenu(self)
         
-        for user in self.users:
-            row = self.users_table.rowCount()
-            self.users_table.insertRow(row)
-            
-            # Set row height explicitly for each row
-            self.users_table.setRowHeight(row, 60)
-            
-            # Column 0: Username with icon
-            username_widget = QWidget()
-            username_layout = QHBoxLayout(username_widget)
-            username_layout.setContentsMargins(12, 0, 0, 0)
-            username_layout.setSpacing(8)
-            
-            # User icon
-            icon_label = QLabel()
-            user_icon = qta.icon('fa5s.user-circle', color='#6b7280')
-            icon_label.setPixmap(user_icon.pixmap(24, 24))
-            username_layout.addWidget(icon_label)
-            
-            # Username text
-            username_label = QLabel(user.get('username', ''))
-            username_label.setStyleSheet("""
-                font-size: 14px;
-                font-weight: 600;
-                color: #1f2937;
-            """)
-            username_layout.addWidget(username_label)
-            username_layout.addStretch()
-            
-            self.users_table.setCellWidget(row, 0, username_widget)
-            
-            # Column 1: Email
-            email_item = QTableWidgetItem(user.get('email', ''))
-            email_item.setForeground(QColor('#6b7280'))
-            email_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter)
-            self.users_table.setItem(row, 1, email_item)
-            
-            # Column 2: Name
-            full_name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
-            name_item = QTableWidgetItem(full_name)
-            name_item.setForeground(QColor('#6b7280'))
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter)
-            self.users_table.setItem(row, 2, name_item)
-            
-            # Column 3: Department
-            dept_name = 'None'
-            if isinstance(user.get('department'), dict):
-                dept_name = user.get('department', {}).get('name', 'None') or 'None'
-            elif user.get('department_id') is not None:
-                dept_name = dept_lookup.get(user.get('department_id'), 'None') or 'None'
-            dept_item = QTableWidgetItem(dept_name)
-            dept_item.setForeground(QColor('#6b7280'))
-            dept_item.setTextAlignment(Qt.AlignmentFlag.AlignVCenter)
-            self.users_table.setItem(row, 3, dept_item)
-            
-            # Column 4: Role badge
-            role = user.get('role', 'user')
-            role_badge = RoleBadge(role)
-            self.users_table.setCellWidget(row, 4, role_badge)
-            
-            # Column 5: Action menu button
-            action_button = UserActionMenuButton(user, self)
-            
-            # Center the button in cell
-            button_container = QWidget()
-            button_layout = QHBoxLayout(button_container)
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            button_layout.addStretch()
-            button_layout.addWidget(action_button)
-            button_layout.addStretch()
-            
-            self.users_table.setCellWidget(row, 5, button_container)
+        # Style the menu
+        menu.setStyleSheet(MENU_STYLE)
+        
+        # Add Edit action
+        edit_action = menu.addAction(
+            cached_icon('fa5s.edit', '#3b82f6'), 
+            "Edit User"
+        )
+        edit_action.triggered.connect(lambda: self.edit_user(self._menu_user))
+        
+        # Add separator
+        menu.addSeparator()
+        
+        # Add Delete action
+        delete_action = menu.addAction(
+            cached_icon('fa5s.trash-alt', '#ef4444'), 
+            "Delete User"
+        )
+        delete_action.triggered.connect(lambda: self.delete_user(self._menu_user))
+        
+        return menu
     
     def edit_user(self, user):
         """Open edit dialog for user."""
-        dialog = UserEditDialog(self.api_client, user, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        # Built on first use, then re-pointed at each user: later edits open
+        # without rebuilding the form
+        departments = self.departments if self._departments_loaded else None
+        if self._edit_dialog is None:
+            self._edit_dialog = UserEditDialog(self.api_client, user, self,
+                                               departments=departments)
+        else:
+            self._edit_dialog.set_user(user, departments)
+        if self._edit_dialog.exec() == QDialog.DialogCode.Accepted:
             self.refresh_users()
     
     def delete_user(self, user):
@@ -762,12 +888,17 @@ class UserManagementView(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            success, message = self.api_client.admin_delete_user(user['id'])
-            if success:
-                QMessageBox.information(self, "Success", "User deleted successfully!")
-                self.refresh_users()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to delete user: {message}")
+            run_api_call(self.api_client.admin_delete_user, user['id'],
+                         on_done=self._on_user_deleted,
+                         on_error=lambda message: self._on_user_deleted((False, message)))
+    
+    def _on_user_deleted(self, result):
+        success, message = result
+        if success:
+            QMessageBox.information(self, "Success", "User deleted successfully!")
+            self.refresh_users()
+        else:
+            QMessageBox.critical(self, "Error", f"Failed to delete user: {message}")
     
     def create_user(self):
         """Open create user dialog."""
@@ -790,30 +921,18 @@ class UserManagementView(QWidget):
         action_bar.setSpacing(12)
 
         add_dept_btn = QPushButton("  Add Department")
-        add_dept_btn.setIcon(qta.icon('fa5s.plus', color='white'))
+        add_dept_btn.setIcon(cached_icon('fa5s.plus', 'white'))
         add_dept_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_dept_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60; color: white; border: none;
-                border-radius: 8px; padding: 8px 16px; font-size: 14px; font-weight: 500;
-            }
-            QPushButton:hover { background-color: #229954; }
-        """)
+        add_dept_btn.setStyleSheet(GREEN_BTN_STYLE)
         add_dept_btn.clicked.connect(self.add_department)
         action_bar.addWidget(add_dept_btn)
 
         action_bar.addStretch()
 
         refresh_dept_btn = QPushButton("Refresh")
-        refresh_dept_btn.setIcon(qta.icon('fa5s.sync-alt', color='#374151'))
+        refresh_dept_btn.setIcon(cached_icon('fa5s.sync-alt', '#374151'))
         refresh_dept_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        refresh_dept_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffffff; color: #374151; border: 1px solid #d1d5db;
-                border-radius: 8px; padding: 8px 16px; font-size: 14px; font-weight: 500;
-            }
-            QPushButton:hover { background-color: #f9fafb; border-color: #9ca3af; }
-        """)
+        refresh_dept_btn.setStyleSheet(GHOST_BTN_STYLE)
         refresh_dept_btn.clicked.connect(self.refresh_departments)
         action_bar.addWidget(refresh_dept_btn)
 
@@ -824,8 +943,9 @@ class UserManagementView(QWidget):
         self.dept_table.setColumnCount(3)
         self.dept_table.setHorizontalHeaderLabels(["ID", "Department Name", ""])
 
+        # An empty QHeaderView is falsy, so test against None
         vh = self.dept_table.verticalHeader()
-        if vh:
+        if vh is not None:
             vh.setVisible(False)
             vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             vh.setDefaultSectionSize(50)
@@ -843,104 +963,193 @@ class UserManagementView(QWidget):
             hh.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
             self.dept_table.setColumnWidth(2, 140)
 
-        self.dept_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #ffffff; border: 1px solid #e5e7eb;
-                border-radius: 8px; gridline-color: transparent;
-            }
-            QTableWidget::item {
-                padding: 0px; border-bottom: 1px solid #f3f4f6;
-            }
-            QTableWidget::item:selected {
-                background-color: #f9fafb; color: #1f2937;
-            }
-            QHeaderView::section {
-                background-color: #f9fafb; color: #6b7280; padding: 12px 8px;
-                border: none; border-bottom: 2px solid #e5e7eb;
-                font-weight: 600; font-size: 12px; text-transform: uppercase; letter-spacing: 0.5px;
-            }
-        """)
+        self.dept_table.setStyleSheet(DEPT_TABLE_STYLE)
         layout.addWidget(self.dept_table)
 
+    def _ensure_dept_tab(self, index: int):
+        """Build the Departments tab the first time it is selected."""
+        if index != self._dept_tab_index or self._dept_built:
+            return
+        self._dept_built = True
+        dept_layout = QVBoxLayout(self._dept_tab)
+        dept_layout.setContentsMargins(0, 12, 0, 0)
+        dept_layout.setSpacing(12)
+        self._setup_departments_tab(dept_layout)
+        # The list itself is already loaded: the users table needs it for names
+        self._populate_dept_table()
+
     def refresh_departments(self):
         """Reload departments into the table."""
-        self.departments = self.api_client.get_departments()
-        self.dept_table.setRowCount(0)
-        for dept in self.departments:
-            row = self.dept_table.rowCount()
-            self.dept_table.insertRow(row)
-            self.dept_table.setRowHeight(row, 50)
-
-            # ID
-            id_item = QTableWidgetItem(str(dept['id']))
-            id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            id_item.setForeground(QColor('#6b7280'))
-            self.dept_table.setItem(row, 0, id_item)
-
-            # Name
-            name_item = QTableWidgetItem(dept['name'])
-            name_item.setForeground(QColor('#1f2937'))
-            self.dept_table.setItem(row, 1, name_item)
-
-            # Action buttons
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 4, 4, 4)
-            actions_layout.setSpacing(6)
-
-            edit_btn = QPushButton()
-            edit_btn.setIcon(qta.icon('fa5s.edit', color='#3b82f6'))
-            edit_btn.setToolTip("Rename")
-            edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            edit_btn.setFixedSize(32, 32)
-            edit_btn.setStyleSheet("""
-                QPushButton { background: transparent; border: none; border-radius: 6px; }
-                QPushButton:hover { background-color: #dbeafe; }
-            """)
-            dept_id = dept['id']
-            dept_name = dept['name']
-            edit_btn.clicked.connect(lambda checked, d=dept_id, n=dept_name: self.rename_department(d, n))
-            actions_layout.addWidget(edit_btn)
-
-            del_btn = QPushButton()
-            del_btn.setIcon(qta.icon('fa5s.trash-alt', color='#ef4444'))
-            del_btn.setToolTip("Delete")
-            del_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            del_btn.setFixedSize(32, 32)
-            del_btn.setStyleSheet("""
-                QPushButton { background: transparent; border: none; border-radius: 6px; }
-                QPushButton:hover { background-color: #fee2e2; }
-            """)
-            del_btn.clicked.connect(lambda checked, d=dept_id, n=dept_name: self.delete_department(d, n))
-            actions_layout.addWidget(del_btn)
-
-            actions_layout.addStretch()
-            self.dept_table.setCellWidget(row, 2, actions_widget)
-
-        # Users list response includes department_id; refresh user rows so names
-        # can be resolved from the latest departments list.
-        if hasattr(self, 'users'):
-            self.populate_table()
+        # As with users: one request at a time, and a refresh asked for
+        # meanwhile reruns once the current one reports back
+        if self._departments_loading:
+            self._departments_reload_pending = True
+            return
+        self._departments_loading = True
+        run_api_call(self.api_client.get_departments,
+                     on_done=self._on_departments_loaded,
+                     on_error=self._on_departments_load_error)
+
+    def _schedule_departments_refresh(self):
+        """Coalesce reloads requested within one event-loop pass into one."""
+        if self._departments_refresh_scheduled:
+            return
+        self._departments_refresh_scheduled = True
+        QTimer.singleShot(0, self._run_scheduled_departments_refresh)
+
+    def _run_scheduled_departments_refresh(self):
+        self._departments_refresh_scheduled = False
+        self.refresh_departments()
+
+    def _on_departments_loaded(self, departments):
+        self._departments_loading = False
+        if self._departments_reload_pending:
+            self._departments_reload_pending = False
+            self.refresh_departments()
+            return
+        self.departments = departments or []
+        self._departments_loaded = True
+        # Users list response includes department_id; let the model resolve
+        # names from the latest departments list.
+        self.users_model.set_departments(self.departments)
+        if self._dept_built:
+            self._populate_dept_table()
+
+    def _populate_dept_table(self):
+        # Repaint once after the whole fill rather than after every row
+        self.dept_table.setUpdatesEnabled(False)
+        try:
+            # Size the table once; rows take the header's fixed 50px height.
+            # Clearing first drops the previous fill's cell widgets.
+            self.dept_table.setRowCount(0)
+            self.dept_table.setRowCount(len(self.departments))
+            for row, dept in enumerate(self.departments):
+
+                # ID
+                id_item = QTableWidgetItem(str(dept['id']))
+                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                id_item.setForeground(MUTED_TEXT_COLOR)
+                self.dept_table.setItem(row, 0, id_item)
+
+                # Name
+                name_item = QTableWidgetItem(dept['name'])
+                name_item.setForeground(TEXT_COLOR)
+                self.dept_table.setItem(row, 1, name_item)
+
+                # Action buttons
+                actions_widget = QWidget()
+                actions_layout = QHBoxLayout(actions_widget)
+                actions_layout.setContentsMargins(4, 4, 4, 4)
+                actions_layout.setSpacing(6)
+
+                edit_btn = QPushButton()
+                edit_btn.setIcon(cached_icon('fa5s.edit', '#3b82f6'))
+                edit_btn.setToolTip("Rename")
+                edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                edit_btn.setFixedSize(32, 32)
+                edit_btn.setObjectName("deptEditButton")
+                edit_btn.setProperty("dept_id", dept['id'])
+                edit_btn.clicked.connect(self._on_dept_button_clicked)
+                actions_layout.addWidget(edit_btn)
+
+                del_btn = QPushButton()
+                del_btn.setIcon(cached_icon('fa5s.trash-alt', '#ef4444'))
+                del_btn.setToolTip("Delete")
+                del_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                del_btn.setFixedSize(32, 32)
+                del_btn.setObjectName("deptDeleteButton")
+                del_btn.setProperty("dept_id", dept['id'])
+                del_btn.clicked.connect(self._on_dept_button_clicked)
+                actions_layout.addWidget(del_btn)
+
+                actions_layout.addStretch()
+                self.dept_table.setCellWidget(row, 2, actions_widget)
+        finally:
+            self.dept_table.setUpdatesEnabled(True)
+
+    def _on_dept_button_clicked(self):
+        """Shared slot for every row's rename/delete button."""
+        button = self.sender()
+        # Buttons carry the department id rather than the row, so rows removed
+        # in place do not leave the buttons below them pointing one row off
+        row = self._dept_row(button.property("dept_id"))
+        if row < 0:
+            return  # Row dropped by a reload since the click was queued
+        dept = self.departments[row]
+        if button.objectName() == "deptEditButton":
+            self.rename_department(dept['id'], dept['name'])
+        else:
+            self.delete_department(dept['id'], dept['name'])
+
+    def _on_departments_load_error(self, message):
+        self._departments_loading = False
+        self._departments_reload_pending = False
+        QMessageBox.critical(self, "Error", f"Failed to load departments: {message}")
+
+    def _dept_row(self, dept_id: int) -> int:
+        """Row of `dept_id` in self.departments (and the departments table)."""
+        for row, dept in enumerate(self.departments):
+            if dept['id'] == dept_id:
+                return row
+        return -1
+
+    def _department_renamed(self, dept_id: int, name: str):
+        """Apply a successful rename to the one affected row."""
+        row = self._dept_row(dept_id)
+        if row < 0:
+            return
+        # Replace rather than mutate: open dialogs compare the list by identity
+        self.departments = [dict(dept, name=name) if i == row else dept
+                            for i, dept in enumerate(self.departments)]
+        self.users_model.set_departments(self.departments)
+        if self._dept_built:
+            self.dept_table.item(row, 1).setText(name)
+
+    def _department_deleted(self, dept_id: int):
+        """Drop a successfully deleted department's row."""
+        # The server unassigns the department's users; reload them so their
+        # rows (and department_id, used by the edit dialog) follow
+        self.refresh_users()
+        row = self._dept_row(dept_id)
+        if row < 0:
+            return
+        self.departments = self.departments[:row] + self.departments[row + 1:]
+        self.users_model.set_departments(self.departments)
+        if self._dept_built:
+            self.dept_table.removeRow(row)
+
+    def _change_department(self, verb: str, fn, *args, on_success=None):
+        """Run a department create/rename/delete call, then update the table.
+
+        `on_success` patches the affected row in place; without one (create,
+        which needs the server-assigned id) the whole list is reloaded.
+        """
+        def done(result):
+            success, msg = result
+            if success:
+                if on_success is not None:
+                    on_success()
+                else:
+                    self._schedule_departments_refresh()
+            else:
+                QMessageBox.critical(self, "Error", f"Failed to {verb} department: {msg}")
+
+        run_api_call(fn, *args, on_done=done, on_error=lambda msg: done((False, msg)))
 
     def add_department(self):
         """Prompt for a department name and create it."""
         name, ok = QInputDialog.getText(self, "Add Department", "Department name:")
         if ok and name.strip():
-            success, msg = self.api_client.create_department(name.strip())
-            if success:
-                self.refresh_departments()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to create department: {msg}")
+            self._change_department("create", self.api_client.create_department, name.strip())
 
     def rename_department(self, dept_id: int, current_name: str):
         """Prompt for new name and update."""
         name, ok = QInputDialog.getText(self, "Rename Department", "New name:", text=current_name)
         if ok and name.strip() and name.strip() != current_name:
-            success, msg = self.api_client.update_department(dept_id, name.strip())
-            if success:
-                self.refresh_departments()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to rename department: {msg}")
+            name = name.strip()
+            self._change_department("rename", self.api_client.update_department,
+                                    dept_id, name,
+                                    on_success=lambda: self._department_renamed(dept_id, name))
 
     def delete_department(self, dept_id: int, name: str):
         """Confirm and delete a department."""
@@ -951,8 +1160,5 @@ class UserManagementView(QWidget):
             QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            success, msg = self.api_client.delete_department(dept_id)
-            if success:
-                self.refresh_departments()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to delete department: {msg}")
+            self._change_department("delete", self.api_client.delete_department, dept_id,
+                                    on_success=lambda: self._department_deleted(dept_id))
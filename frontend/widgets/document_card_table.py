@@ -3,16 +3,40 @@ Modern Document Card Table with Action Menu
 Implements clean UI/UX with hidden actions in dropdown menu
 """
 from PyQt6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, 
-    QHBoxLayout, QWidget, QMenu, QLabel, QVBoxLayout
+    QApplication, QTableView, QHeaderView, QStyledItemDelegate,
+    QStyleOptionViewItem, QStyle, QWidget, QMenu, QLabel
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor
-import qtawesome as qta
+from PyQt6.QtCore import (
+    Qt, QSize, QRect, QPoint, QEvent, QAbstractTableModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor, QPainter, QIcon, QPixmap
+
+from utils.icon_cache import cached_icon, cached_pixmap
+
+
+ACTION_MENU_STYLE = """
+    QMenu {
+        background-color: white;
+        border: 1px solid #e5e7eb;
+        border-radius: 8px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 8px 20px 8px 40px;
+        border-radius: 4px;
+        margin: 2px 4px;
+    }
+    QMenu::item:selected {
+        background-color: #f3f4f6;
+    }
+    QMenu::icon {
+        left: 12px;
+    }
+"""
 
 
-class ClassificationBadge(QWidget):
-    """Custom widget for classification badges with color coding.
+class ClassificationBadgeDelegate(QStyledItemDelegate):
+    """Paints the color-coded classification pill for the Security Level column.
     
     Handles classification_status from the async classification pipeline:
     - queued/extracting_text/classifying → "Classifying..." dimmed badge
@@ -22,94 +46,107 @@ class ClassificationBadge(QWidget):
     """
     
     CLASSIFICATION_COLORS = {
-        'public': ('#10b981', '#d1fae5'),      # Green
-        'internal': ('#3b82f6', '#dbeafe'),    # Blue
-        'confidential': ('#ef4444', '#fee2e2'), # Red
-        'unclassified': ('#6b7280', '#f3f4f6')  # Gray
+        'public': (QColor('#10b981'), QColor('#d1fae5')),      # Green
+        'internal': (QColor('#3b82f6'), QColor('#dbeafe')),    # Blue
+        'confidential': (QColor('#ef4444'), QColor('#fee2e2')), # Red
+        'unclassified': (QColor('#6b7280'), QColor('#f3f4f6'))  # Gray
     }
 
     # Status colors for non-completed classification states
     STATUS_COLORS = {
-        'classifying': ('#6b7280', '#f3f4f6'),    # Gray dimmed
-        'failed': ('#dc2626', '#fef2f2'),          # Red
-        'needs_review': ('#d97706', '#fffbeb'),    # Amber
+        'classifying': (QColor('#6b7280'), QColor('#f3f4f6')),    # Gray dimmed
+        'failed': (QColor('#dc2626'), QColor('#fef2f2')),          # Red
+        'needs_review': (QColor('#d97706'), QColor('#fffbeb')),    # Amber
     }
+
+    CLASSIFYING_TEXT = 'CLASSIFYING...'
+    FAILED_TEXT = 'FAILED'
+    NEEDS_REVIEW_TEXT = 'NEEDS REVIEW'
+
+    BADGE_HEIGHT = 25
+    H_PADDING = 18
+    # Space kept between the widest pill and the column edges
+    CELL_MARGIN = 12
     
-    def __init__(self, classification: str, classification_status: str = 'completed',
-                 classification_error: str = '', parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.classification = classification.lower()
-        self.classification_status = classification_status or 'completed'
-        self.classification_error = classification_error or ''
-        self.setMinimumHeight(40)  # Ensure minimum height
-        self.setup_ui()
-    
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)  # No padding
-        layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
+        self._font = QFont()
+        self._font.setPixelSize(11)
+        self._font.setBold(True)
 
-        # Determine badge text and colors based on classification_status
-        badge_text, text_color, bg_color, tooltip = self._resolve_badge()
-        
-        # Create badge label
-        badge = QLabel(badge_text)
-        badge.setMinimumHeight(24)  # Ensure minimum height for badge
-        badge.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {text_color};
-                border-radius: 12px;
-                padding: 6px 14px;
-                font-size: 11px;
-                font-weight: bold;
-            }}
-        """)
-        if tooltip:
-            badge.setToolTip(tooltip)
-        
-        layout.addStretch()
-        layout.addWidget(badge)
-        layout.addStretch()
+    def column_width(self) -> int:
+        """Width that fits the widest badge this delegate can paint."""
+        labels = [self.CLASSIFYING_TEXT, self.FAILED_TEXT, self.NEEDS_REVIEW_TEXT]
+        labels.extend(name.upper() for name in self.CLASSIFICATION_COLORS)
+        metrics = QFontMetrics(self._font)
+        widest = max(metrics.horizontalAdvance(label) for label in labels)
+        return widest + 2 * (self.H_PADDING + self.CELL_MARGIN)
 
-    def _resolve_badge(self) -> tuple:
+    @classmethod
+    def resolve_badge(cls, doc: dict) -> tuple:
         """Resolve badge text, colors, and tooltip based on classification status.
         
         Returns:
             (badge_text, text_color, bg_color, tooltip)
         """
-        status = self.classification_status
+        classification = (doc.get('classification') or 'unclassified').lower()
+        status = doc.get('classification_status') or 'completed'
 
         # In-progress states: queued, extracting_text, classifying
         if status in ('queued', 'extracting_text', 'classifying'):
-            text_color, bg_color = self.STATUS_COLORS['classifying']
-            return ('CLASSIFYING...', text_color, bg_color, 'Classification in progress')
+            text_color, bg_color = cls.STATUS_COLORS['classifying']
+            return (cls.CLASSIFYING_TEXT, text_color, bg_color, 'Classification in progress')
 
         # Failed state
         if status == 'failed':
-            text_color, bg_color = self.STATUS_COLORS['failed']
-            tooltip = self.classification_error if self.classification_error else 'Classification failed'
-            return ('FAILED', text_color, bg_color, tooltip)
+            text_color, bg_color = cls.STATUS_COLORS['failed']
+            tooltip = doc.get('classification_error') or 'Classification failed'
+            return (cls.FAILED_TEXT, text_color, bg_color, tooltip)
 
         # Completed but unclassified → needs review
-        if status == 'completed' and self.classification == 'unclassified':
-            text_color, bg_color = self.STATUS_COLORS['needs_review']
-            return ('NEEDS REVIEW', text_color, bg_color, 'Classification completed but result is unclassified')
+        if status == 'completed' and classification == 'unclassified':
+            text_color, bg_color = cls.STATUS_COLORS['needs_review']
+            return (cls.NEEDS_REVIEW_TEXT, text_color, bg_color, 'Classification completed but result is unclassified')
 
         # Normal completed state
-        text_color, bg_color = self.CLASSIFICATION_COLORS.get(
-            self.classification,
-            self.CLASSIFICATION_COLORS['unclassified']
+        text_color, bg_color = cls.CLASSIFICATION_COLORS.get(
+            classification,
+            cls.CLASSIFICATION_COLORS['unclassified']
         )
-        return (self.classification.upper(), text_color, bg_color, '')
+        return (classification.upper(), text_color, bg_color, '')
+
+    def paint(self, painter, option, index):
+        # Base paint draws only the background/selection: the column has no text
+        super().paint(painter, option, index)
+        badge = index.data(DocumentTableModel.BadgeRole)
+        if badge is None:
+            return
+        label, text_color, bg_color, _ = badge
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        width = painter.fontMetrics().horizontalAdvance(label) + 2 * self.H_PADDING
+        rect = QRect(option.rect.left() + (option.rect.width() - width) // 2,
+                     option.rect.top() + (option.rect.height() - self.BADGE_HEIGHT) // 2,
+                     width, self.BADGE_HEIGHT)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bg_color)
+        painter.drawRoundedRect(rect, 12, 12)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
+        painter.restore()
 
 
-class DepartmentBadges(QWidget):
-    """Widget that renders 1-N department name pills in a horizontal flow.
+class DepartmentBadgesDelegate(QStyledItemDelegate):
+    """Paints 1-N department name pills for the Relevant Depts. column.
 
-    Shows compact colored badges for each AI-inferred department tag.
-    If no departments: shows '—' in muted gray.
+    Shows compact colored badges for each AI-inferred department tag,
+    stacked 2 per row. If no departments: shows '—' in muted gray.
     If classification is in progress: shows 'Pending...' in gray.
+
+    Each distinct pill is rendered once from a styled QLabel into a pixmap
+    shared by every row (flyweight), so painting a cell only blits pixmaps.
     """
 
     BADGE_COLORS = [
@@ -121,290 +158,424 @@ class DepartmentBadges(QWidget):
         ('#64748b', '#f1f5f9'),   # Slate
     ]
 
-    def __init__(self, departments: list, classification_status: str = 'completed', parent=None):
-        super().__init__(parent)
-        self.departments = departments or []
-        self.classification_status = classification_status or 'completed'
-        self.setMinimumHeight(40)
-        self.setup_ui()
+    BADGE_STYLES = [
+        f"""
+            QLabel {{
+                background-color: {bg_color};
+                color: {text_color};
+                border-radius: 10px;
+                padding: 5px 10px;
+                font-size: 9px;
+                font-weight: 600;
+            }}
+        """
+        for text_color, bg_color in BADGE_COLORS
+    ]
+    PENDING_STYLE = """
+        QLabel {
+            color: #9ca3af;
+            font-size: 11px;
+            font-style: italic;
+        }
+    """
+    EMPTY_STYLE = """
+        QLabel {
+            color: #d1d5db;
+            font-size: 13px;
+        }
+    """
 
-    def setup_ui(self):
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(4, 4, 4, 4)
-        main_layout.setSpacing(6)
-        main_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
+    ITEMS_PER_ROW = 2
+    MARGIN = 4
+    SPACING = 6
 
-        # In-progress states
-        if self.classification_status in ('queued', 'extracting_text', 'classifying'):
-            pending = QLabel('Pending...')
-            pending.setStyleSheet("""
-                QLabel {
-                    color: #9ca3af;
-                    font-size: 11px;
-                    font-style: italic;
-                }
-            """)
-            main_layout.addWidget(pending, alignment=Qt.AlignmentFlag.AlignHCenter)
-            return
+    # (text, stylesheet) -> pixmap, shared by all tables
+    _pixmaps = {}
 
-        # Extract valid department names and their original indices for color consistency
-        valid_depts = []
-        for i, dept in enumerate(self.departments):
-            dept_name = dept.get('department_name', '') if isinstance(dept, dict) else str(dept)
-            if dept_name:
-                valid_depts.append((dept_name, i))
+    @classmethod
+    def _label_pixmap(cls, text: str, style: str) -> QPixmap:
+        key = (text, style)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            label = QLabel(text)
+            label.setStyleSheet(style)
+            label.ensurePolished()
+            label.resize(label.sizeHint())
+            ratio = QApplication.instance().devicePixelRatio()
+            pixmap = QPixmap(label.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            label.render(pixmap, flags=QWidget.RenderFlag.DrawChildren)
+            cls._pixmaps[key] = pixmap
+        return pixmap
+
+    def _pixmap_rows(self, departments) -> list:
+        """Lay the cell's pixmaps out as rows of at most ITEMS_PER_ROW."""
+        # In-progress states
+        if departments is None:
+            return [[self._label_pixmap('Pending...', self.PENDING_STYLE)]]
 
         # No valid departments tagged
-        if not valid_depts:
-            empty = QLabel('—')
-            empty.setStyleSheet("""
-                QLabel {
-                    color: #d1d5db;
-                    font-size: 13px;
-                }
-            """)
-            main_layout.addWidget(empty, alignment=Qt.AlignmentFlag.AlignHCenter)
-            return
+        if not departments:
+            return [[self._label_pixmap('—', self.EMPTY_STYLE)]]
 
-        # Render department badges stacked 2 per row
-        ITEMS_PER_ROW = 2
-        for i in range(0, len(valid_depts), ITEMS_PER_ROW):
-            row_layout = QHBoxLayout()
-            row_layout.setContentsMargins(0, 0, 0, 0)
-            row_layout.setSpacing(6)
-            row_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-            
-            row_depts = valid_depts[i:i+ITEMS_PER_ROW]
-            for dept_name, original_idx in row_depts:
-                text_color, bg_color = self.BADGE_COLORS[original_idx % len(self.BADGE_COLORS)]
-                badge = QLabel(dept_name)
-                badge.setStyleSheet(f"""
-                    QLabel {{
-                        background-color: {bg_color};
-                        color: {text_color};
-                        border-radius: 10px;
-                        padding: 5px 10px;
-                        font-size: 9px;
-                        font-weight: 600;
-                    }}
-                """)
-                row_layout.addWidget(badge)
-            
-            main_layout.addLayout(row_layout)
-
-
-class ActionMenuButton(QPushButton):
-    """Custom button that shows a dropdown menu with actions"""
-    
-    def __init__(self, actions: dict, row: int, parent=None):
+        # Color by original index so a department keeps its color across rows
+        badges = [
+            self._label_pixmap(name, self.BADGE_STYLES[i % len(self.BADGE_STYLES)])
+            for name, i in departments
+        ]
+        return [badges[i:i + self.ITEMS_PER_ROW] for i in range(0, len(badges), self.ITEMS_PER_ROW)]
+
+    def _row_size(self, row: list) -> QSize:
+        sizes = [pixmap.deviceIndependentSize().toSize() for pixmap in row]
+        return QSize(sum(size.width() for size in sizes) + self.SPACING * (len(sizes) - 1),
+                     max(size.height() for size in sizes))
+
+    def sizeHint(self, option, index):
+        row_sizes = [self._row_size(row) for row in
+                     self._pixmap_rows(index.data(DocumentTableModel.DepartmentsRole))]
+        return QSize(
+            max(size.width() for size in row_sizes) + 2 * self.MARGIN,
+            sum(size.height() for size in row_sizes)
+            + self.SPACING * (len(row_sizes) - 1) + 2 * self.MARGIN,
+        )
+
+    def paint(self, painter, option, index):
+        # Base paint draws only the background/selection: the column has no text
+        super().paint(painter, option, index)
+        rows = self._pixmap_rows(index.data(DocumentTableModel.DepartmentsRole))
+        row_sizes = [self._row_size(row) for row in rows]
+
+        # Lay out inside the item's content rect, as the cell widget this
+        # replaces was, so the pills stay clear of the row's bottom border
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        cell = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, opt.widget)
+        area = cell.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        total_height = (sum(size.height() for size in row_sizes)
+                        + self.SPACING * (len(rows) - 1))
+        y = area.top() + (area.height() - total_height) // 2
+        for row, size in zip(rows, row_sizes):
+            x = area.left() + (area.width() - size.width()) // 2
+            for pixmap in row:
+                painter.drawPixmap(x, y, pixmap)
+                x += pixmap.deviceIndependentSize().toSize().width() + self.SPACING
+            y += size.height() + self.SPACING
+
+
+class ActionMenuDelegate(QStyledItemDelegate):
+    """Paints the "more actions" button and reports clicks on it."""
+
+    menu_requested = pyqtSignal(int, QPoint)
+
+    BUTTON_SIZE = 40
+    ICON_SIZE = 18
+    HOVER_COLOR = QColor('#f3f4f6')
+
+    def __init__(self, view: QTableView):
+        super().__init__(view)
+        self._view = view
+
+    def _button_rect(self, cell: QRect) -> QRect:
+        rect = QRect(0, 0, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        rect.moveCenter(cell.center())
+        return rect
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        button = self._button_rect(option.rect)
+
+        painter.save()
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.HOVER_COLOR)
+            painter.drawEllipse(button)
+        icon_rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+        icon_rect.moveCenter(button.center())
+        painter.drawPixmap(icon_rect, cached_pixmap('fa5s.ellipsis-v', '#6b7280', self.ICON_SIZE))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            button = self._button_rect(option.rect)
+            if button.contains(event.position().toPoint()):
+                anchor = self._view.viewport().mapToGlobal(button.bottomLeft())
+                self.menu_requested.emit(index.row(), anchor)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class DocumentNameDelegate(QStyledItemDelegate):
+    """Paints the file-type icon and document name, centered as a pair."""
+
+    TEXT_COLOR = QColor('#0f1016')
+    H_MARGIN = 8
+    SPACING = 12
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.action_callbacks = actions  # Store as different name to avoid conflict
-        self.row = row
-        self.setup_ui()
-    
-    def setup_ui(self):
-        # Set icon - three vertical dots
-        self.setIcon(qta.icon('fa5s.ellipsis-v', color='#6b7280'))
-        self.setIconSize(QSize(18, 18))
-        self.setToolTip("More actions")
-        
-        # Style the button
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 18px;
-                padding: 8px 14px;
-                min-width: 40px;
-                max-width: 40px;
-                min-height: 40px;
-                max-height: 40px;
-            }
-            QPushButton:hover {
-                background-color: #f3f4f6;
-            }
-            QPushButton:pressed {
-                background-color: #e5e7eb;
-            }
-        """)
-        
-        # Connect to show menu
-        self.clicked.connect(self.show_menu)
-    
-    def show_menu(self):
-        """Show dropdown menu with available actions"""
-        menu = QMenu(self)
-        
-        # Style the menu
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 8px 20px 8px 40px;
-                border-radius: 4px;
-                margin: 2px 4px;
-            }
-            QMenu::item:selected {
-                background-color: #f3f4f6;
-            }
-            QMenu::icon {
-                left: 12px;
-            }
-        """)
-        
-        # Add actions to menu
-        if 'view' in self.action_callbacks:
-            view_action = menu.addAction(
-                qta.icon('fa5s.eye', color='#3b82f6'), 
-                "View Document"
-            )
-            view_action.triggered.connect(lambda: self.action_callbacks['view'](self.row))
-        
-        if 'download' in self.action_callbacks:
-            download_action = menu.addAction(
-                qta.icon('fa5s.download', color='#10b981'), 
-                "Download"
-            )
-            download_action.triggered.connect(lambda: self.action_callbacks['download'](self.row))
-        
-        if 'share' in self.action_callbacks:
-            menu.addSeparator()
-            share_action = menu.addAction(
-                qta.icon('fa5s.share-alt', color='#f59e0b'), 
-                "Share"
-            )
-            share_action.triggered.connect(lambda: self.action_callbacks['share'](self.row))
-        
-        if 'manage_sharing' in self.action_callbacks:
-            manage_action = menu.addAction(
-                qta.icon('fa5s.users-cog', color='#8b5cf6'), 
-                "Manage Sharing"
-            )
-            manage_action.triggered.connect(lambda: self.action_callbacks['manage_sharing'](self.row))
-        
-        if 'retry' in self.action_callbacks:
-            if menu.actions():
-                menu.addSeparator()
-            retry_action = menu.addAction(
-                qta.icon('fa5s.redo', color='#f59e0b'),
-                "Retry Classification"
-            )
-            retry_action.triggered.connect(lambda: self.action_callbacks['retry'](self.row))
-        
-        if 'change_classification' in self.action_callbacks:
-            if menu.actions() and 'retry' not in self.action_callbacks:
-                menu.addSeparator()
-            change_action = menu.addAction(
-                qta.icon('fa5s.tag', color='#6366f1'),
-                "Change Classification"
-            )
-            change_action.triggered.connect(lambda: self.action_callbacks['change_classification'](self.row))
-        
-        if 'delete' in self.action_callbacks:
-            if menu.actions():  # Only add separator if there are other actions
-                menu.addSeparator()
-            delete_action = menu.addAction(
-                qta.icon('fa5s.trash-alt', color='#ef4444'), 
-                "Delete"
-            )
-            delete_action.triggered.connect(lambda: self.action_callbacks['delete'](self.row))
-        
-        # Show menu at button position
-        menu.exec(self.mapToGlobal(self.rect().bottomLeft()))
+        self._font = QFont()
+        self._font.setPixelSize(14)
+        self._font.setWeight(QFont.Weight.Medium)
+
+    def paint(self, painter, option, index):
+        # Base paint draws only the background/selection; text is drawn below
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ''
+        opt.icon = QIcon()
+        opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasDecoration
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        filename = index.data(Qt.ItemDataRole.DisplayRole) or ''
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        icon_size = DocumentTableModel.FILE_ICON_SIZE
+
+        painter.save()
+        painter.setFont(self._font)
+        metrics = painter.fontMetrics()
+        area = option.rect.adjusted(self.H_MARGIN, 0, -self.H_MARGIN, 0)
+        text_width = metrics.boundingRect(QRect(), Qt.AlignmentFlag.AlignLeft, filename).width()
+        group_width = icon_size + self.SPACING + text_width
+        # Center the pair, rounding up like the stretch layout it replaces
+        left = area.left() + max(0, (area.width() - group_width + 1) // 2)
+        if pixmap is not None:
+            painter.drawPixmap(left, area.top() + (area.height() - icon_size) // 2, pixmap)
+        text_rect = QRect(left + icon_size + self.SPACING, area.top(),
+                          area.right() - left - icon_size - self.SPACING + 1, area.height())
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         metrics.elidedText(filename, Qt.TextElideMode.ElideRight, text_rect.width()))
+        painter.restore()
+
+
+class DocumentTableModel(QAbstractTableModel):
+    """Table model over the raw document dicts shown by ModernDocumentTable.
+
+    The document name (with its file-type icon), owner and upload date are
+    served as display data; the remaining columns are rendered by the view
+    and its delegates.
+    """
+
+    DOCUMENT, CLASSIFICATION, DEPARTMENTS, OWNER, DATE, ACTIONS = range(6)
+    DocumentRole = Qt.ItemDataRole.UserRole
+    BadgeRole = Qt.ItemDataRole.UserRole + 1  # (text, text color, bg color, tooltip)
+    # ((name, original index), ...) or None while classification is running
+    DepartmentsRole = Qt.ItemDataRole.UserRole + 2
+
+    TEXT_COLOR = QColor('#6b7280')
+    FILE_ICON_SIZE = 28
+
+    FILE_ICONS = {
+        'pdf': ('fa5s.file-pdf', '#ef4444'),
+        'doc': ('fa5s.file-word', '#3b82f6'),
+        'docx': ('fa5s.file-word', '#3b82f6'),
+        'xls': ('fa5s.file-excel', '#10b981'),
+        'xlsx': ('fa5s.file-excel', '#10b981'),
+        'ppt': ('fa5s.file-powerpoint', '#f59e0b'),
+        'pptx': ('fa5s.file-powerpoint', '#f59e0b'),
+        'txt': ('fa5s.file-alt', '#6b7280'),
+        'jpg': ('fa5s.file-image', '#8b5cf6'),
+        'jpeg': ('fa5s.file-image', '#8b5cf6'),
+        'png': ('fa5s.file-image', '#8b5cf6'),
+        'zip': ('fa5s.file-archive', '#f59e0b'),
+        'rar': ('fa5s.file-archive', '#f59e0b'),
+    }
+    DEFAULT_FILE_ICON = ('fa5s.file', '#6b7280')
+
+    def __init__(self, headers: list, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+
+    def set_documents(self, documents: list):
+        self.beginResetModel()
+        # data() runs for every visible cell on every paint, so the displayed
+        # values are derived once per load instead
+        self._rows = [self._display_row(doc) for doc in documents]
+        self.endResetModel()
+
+    def _display_row(self, doc: dict) -> tuple:
+        """Return (doc, filename, icon spec, badge, departments, owner, date) for one document."""
+        filename = doc.get('filename', '')
+
+        owner = doc.get('owner')
+        if owner and isinstance(owner, dict):
+            owner_text = owner.get('username', '')
+        else:
+            owner_text = str(owner) if owner else ''
+
+        if doc.get('classification_status') in ('queued', 'extracting_text', 'classifying'):
+            departments = None
+        else:
+            # Keep each name's original index for color consistency
+            departments = []
+            for i, dept in enumerate(doc.get('departments') or []):
+                dept_name = dept.get('department_name', '') if isinstance(dept, dict) else str(dept)
+                if dept_name:
+                    departments.append((dept_name, i))
+            departments = tuple(departments)
+
+        date_str = doc.get('upload_date') or ''
+        return (
+            doc,
+            filename,
+            # Rasterized on first paint, so types never scrolled into view
+            # are never rendered
+            self.file_icon_spec(filename),
+            ClassificationBadgeDelegate.resolve_badge(doc),
+            departments,
+            owner_text,
+            date_str.split('T', 1)[0],
+        )
+
+    def document_at(self, row: int) -> dict:
+        return self._rows[row][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        doc, filename, icon_spec, badge, departments, owner, date = self._rows[index.row()]
+        if role == self.DocumentRole:
+            return doc
+
+        column = index.column()
+        if column == self.DOCUMENT:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return filename
+            if role == Qt.ItemDataRole.DecorationRole:
+                return cached_pixmap(*icon_spec, self.FILE_ICON_SIZE)
+            return None
+        if column == self.CLASSIFICATION:
+            if role == self.BadgeRole:
+                return badge
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return badge[3] or None
+            return None
+        if column == self.DEPARTMENTS:
+            return departments if role == self.DepartmentsRole else None
+        if column == self.ACTIONS:
+            return "More actions" if role == Qt.ItemDataRole.ToolTipRole else None
+        if column not in (self.OWNER, self.DATE):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return owner if column == self.OWNER else date
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.TEXT_COLOR
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    @classmethod
+    def file_icon_spec(cls, filename: str) -> tuple:
+        """Return the (icon_name, color) pair for a file's extension"""
+        extension = filename.split('.')[-1].lower() if '.' in filename else ''
+        return cls.FILE_ICONS.get(extension, cls.DEFAULT_FILE_ICON)
 
 
-class ModernDocumentTable(QTableWidget):
+class ModernDocumentTable(QTableView):
     """
     Modern document table with card-like design and hidden action menu.
     Follows best UI/UX practices with clean, minimal interface.
     """
+
+    DATE_SAMPLE = '0000-00-00'
+    DATE_MARGIN = 25
     
     def __init__(self, headers=None, parent=None):
         super().__init__(parent)
+        # Styled by the #documentTable rules in style.qss, parsed once for the
+        # whole app rather than once per table. Named before anything polishes
+        # the view, since a later rename does not restyle it.
+        self.setObjectName("documentTable")
         
         # Default headers if none provided
         if headers is None:
             headers = ["Document", "Security Level", "Relevant Depts.", "Owner", "Upload Date", ""]
         
         self.headers = headers
+        self.documents_model = DocumentTableModel(headers, self)
+        self.setModel(self.documents_model)
+        self._callback_getter = lambda row: {}
+        # Action menus are built once per distinct set of actions and
+        # retargeted at the clicked row before each exec()
+        self._action_menus = {}
+        self._menu_row = -1
+        self._menu_callbacks = {}
         self.setup_ui()
     
     def setup_ui(self):
         """Initialize table UI with modern styling"""
-        self.setColumnCount(len(self.headers))
-        self.setHorizontalHeaderLabels(self.headers)
-        
         # Hide row numbers
         vertical_header = self.verticalHeader()
-        if vertical_header:
+        if vertical_header is not None:
             vertical_header.setVisible(False)
         
         # Set table properties
-        self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.setAlternatingRowColors(False)  # We'll use custom row styling
         self.setShowGrid(False)
+        # Hover feedback on the painted action button
+        self.setMouseTracking(True)
         
         # Set fixed row height - not adjustable by user
         v_header = self.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
             v_header.setDefaultSectionSize(75)
         
         # Configure column behavior
         header = self.horizontalHeader()
-        if header:
+        if header is not None:
             header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
             # Document name - stretch
             header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            # Security Level - fixed width
+            self.setItemDelegateForColumn(
+                DocumentTableModel.DOCUMENT, DocumentNameDelegate(self)
+            )
+            # Security Level - fixed width, measured once from the badge labels
+            # rather than from the rows
+            badge_delegate = ClassificationBadgeDelegate(self)
             header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
-            self.setColumnWidth(1, 150)
+            self.setColumnWidth(1, badge_delegate.column_width())
+            self.setItemDelegateForColumn(DocumentTableModel.CLASSIFICATION, badge_delegate)
             # Relevant Depts. - natural sizing for departments
             header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+            self.setItemDelegateForColumn(
+                DocumentTableModel.DEPARTMENTS, DepartmentBadgesDelegate(self)
+            )
             # Owner - interactive
             header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
             self.setColumnWidth(3, 150)
-            # Date - interactive
+            # Date - interactive, sized for an ISO date
             header.setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
-            self.setColumnWidth(4, 120)
+            self.setColumnWidth(
+                4, self.fontMetrics().horizontalAdvance(self.DATE_SAMPLE) + 2 * self.DATE_MARGIN
+            )
             # Actions - fixed width
             header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
             self.setColumnWidth(5, 60)
+            self._action_delegate = ActionMenuDelegate(self)
+            self._action_delegate.menu_requested.connect(self.show_action_menu)
+            self.setItemDelegateForColumn(DocumentTableModel.ACTIONS, self._action_delegate)
         
-        # Apply modern styling
-        self.setStyleSheet("""
-            QTableWidget {
-                background-color: #ffffff;
-                border: 1px solid #e5e7eb;
-                border-radius: 8px;
-                gridline-color: transparent;
-            }
-            QTableWidget::item {
-                padding: 0px;
-                border-bottom: 1px solid #f3f4f6;
-            }
-            QTableWidget::item:selected {
-                background-color: #f9fafb;
-                color: #0f1016;
-            }
-            QHeaderView::section {
-                background-color: #f9fafb;
-                color: #6b7280;
-                padding: 12px 8px;
-                border: none;
-                border-bottom: 2px solid #e5e7eb;
-                font-weight: 600;
-                font-size: 12px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-        """)
     
     def set_documents(self, documents: list, action_callbacks: dict):
         """
@@ -414,64 +585,7 @@ class ModernDocumentTable(QTableWidget):
             documents: List of document dictionaries
             action_callbacks: Dict mapping action names to callback functions
         """
-        self.setRowCount(len(documents))
-        
-        for row, doc in enumerate(documents):
-            # Set row height explicitly for each row
-            self.setRowHeight(row, 75)
-            
-            # Column 0: Document name with file icon
-            doc_widget = self._create_document_cell(doc)
-            self.setCellWidget(row, 0, doc_widget)
-            
-            # Column 1: Classification badge (status-aware)
-            classification = doc.get('classification', 'unclassified')
-            classification_status = doc.get('classification_status', 'completed')
-            classification_error = doc.get('classification_error', '')
-            badge_widget = ClassificationBadge(
-                classification, classification_status, classification_error
-            )
-            self.setCellWidget(row, 1, badge_widget)
-
-            # Column 2: Department badges
-            departments = doc.get('departments', [])
-            dept_widget = DepartmentBadges(departments, classification_status)
-            self.setCellWidget(row, 2, dept_widget)
-            
-            # Column 3: Owner
-            owner = doc.get('owner')
-            owner_text = ''
-            if owner and isinstance(owner, dict):
-                owner_text = owner.get('username', '')
-            elif owner:
-                owner_text = str(owner)
-            
-            owner_item = QTableWidgetItem(owner_text)
-            owner_item.setForeground(QColor('#6b7280'))
-            owner_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 3, owner_item)
-            
-            # Column 4: Date
-            date_str = doc.get('upload_date', '')
-            if date_str:
-                date_str = date_str.split('T')[0]
-            date_item = QTableWidgetItem(date_str)
-            date_item.setForeground(QColor('#6b7280'))
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 4, date_item)
-            
-            # Column 5: Action menu button
-            action_button = ActionMenuButton(action_callbacks, row)
-            
-            # Center the button in cell
-            button_container = QWidget()
-            button_layout = QHBoxLayout(button_container)
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            button_layout.addStretch()
-            button_layout.addWidget(action_button)
-            button_layout.addStretch()
-            
-            self.setCellWidget(row, 5, button_container)
+        self.set_documents_with_row_callbacks(documents, lambda row: action_callbacks)
     
     def set_documents_with_row_callbacks(self, documents: list, callback_getter):
         """
@@ -481,119 +595,83 @@ class ModernDocumentTable(QTableWidget):
             documents: List of document dictionaries
             callback_getter: Function that takes row index and returns action callbacks dict
         """
-        self.setRowCount(len(documents))
+        # Callbacks are only looked up for the row whose menu is opened
+        self._callback_getter = callback_getter
+        self.documents_model.set_documents(documents)
+
+    def show_action_menu(self, row: int, pos: QPoint):
+        """Show the dropdown menu with the actions available for a row."""
+        callbacks = self._callback_getter(row)
+        key = frozenset(callbacks)
+        menu = self._action_menus.get(key)
+        if menu is None:
+            menu = self._action_menus[key] = self._build_action_menu(key)
+        self._menu_row = row
+        self._menu_callbacks = callbacks
+        menu.exec(pos)
+
+    def _run_action(self, action: str):
+        self._menu_callbacks[action](self._menu_row)
+
+    def _build_action_menu(self, actions: frozenset) -> QMenu:
+        menu = QMenu(self)
+        menu.setStyleSheet(ACTION_MENU_STYLE)
         
-        for row, doc in enumerate(documents):
-            # Set row height explicitly for each row
-            self.setRowHeight(row, 75)
-            
-            # Column 0: Document name with file icon
-            doc_widget = self._create_document_cell(doc)
-            self.setCellWidget(row, 0, doc_widget)
-            
-            # Column 1: Classification badge (status-aware)
-            classification = doc.get('classification', 'unclassified')
-            classification_status = doc.get('classification_status', 'completed')
-            classification_error = doc.get('classification_error', '')
-            badge_widget = ClassificationBadge(
-                classification, classification_status, classification_error
+        # Add actions to menu
+        if 'view' in actions:
+            view_action = menu.addAction(
+                cached_icon('fa5s.eye', '#3b82f6'), 
+                "View Document"
             )
-            self.setCellWidget(row, 1, badge_widget)
-
-            # Column 2: Department badges
-            departments = doc.get('departments', [])
-            dept_widget = DepartmentBadges(departments, classification_status)
-            self.setCellWidget(row, 2, dept_widget)
-            
-            # Column 3: Owner
-            owner = doc.get('owner')
-            owner_text = ''
-            if owner and isinstance(owner, dict):
-                owner_text = owner.get('username', '')
-            elif owner:
-                owner_text = str(owner)
-            
-            owner_item = QTableWidgetItem(owner_text)
-            owner_item.setForeground(QColor('#6b7280'))
-            owner_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 3, owner_item)
-            
-            # Column 4: Date
-            date_str = doc.get('upload_date', '')
-            if date_str:
-                date_str = date_str.split('T')[0]
-            date_item = QTableWidgetItem(date_str)
-            date_item.setForeground(QColor('#6b7280'))
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 4, date_item)
-            
-            # Column 5: Action menu button with row-specific callbacks
-            action_callbacks = callback_getter(row)
-            action_button = ActionMenuButton(action_callbacks, row)
-            
-            # Center the button in cell
-            button_container = QWidget()
-            button_layout = QHBoxLayout(button_container)
-            button_layout.setContentsMargins(0, 0, 0, 0)
-            button_layout.addStretch()
-            button_layout.addWidget(action_button)
-            button_layout.addStretch()
-            
-            self.setCellWidget(row, 5, button_container)
-    
-    def _create_document_cell(self, doc: dict) -> QWidget:
-        """Create a widget for document name with icon"""
-        widget = QWidget()
-        widget.setMinimumHeight(50)  # Ensure minimum height
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(8, 0, 8, 0)  # Minimal horizontal padding only
-        layout.setSpacing(12)
+            view_action.triggered.connect(lambda: self._run_action('view'))
         
-        # File icon based on extension
-        filename = doc.get('filename', '')
-        file_icon = self._get_file_icon(filename)
+        if 'download' in actions:
+            download_action = menu.addAction(
+                cached_icon('fa5s.download', '#10b981'), 
+                "Download"
+            )
+            download_action.triggered.connect(lambda: self._run_action('download'))
         
-        icon_label = QLabel()
-        icon_label.setPixmap(file_icon.pixmap(QSize(28, 28)))  # Larger icon
-        icon_label.setFixedSize(28, 28)
+        if 'share' in actions:
+            menu.addSeparator()
+            share_action = menu.addAction(
+                cached_icon('fa5s.share-alt', '#f59e0b'), 
+                "Share"
+            )
+            share_action.triggered.connect(lambda: self._run_action('share'))
         
-        layout.addStretch()
-        layout.addWidget(icon_label)
+        if 'manage_sharing' in actions:
+            manage_action = menu.addAction(
+                cached_icon('fa5s.users-cog', '#8b5cf6'), 
+                "Manage Sharing"
+            )
+            manage_action.triggered.connect(lambda: self._run_action('manage_sharing'))
         
-        # File name label
-        name_label = QLabel(filename)
-        name_label.setStyleSheet("""
-            QLabel {
-                color: #0f1016;
-                font-size: 14px;
-                font-weight: 500;
-            }
-        """)
-        name_label.setMinimumHeight(30)
-        layout.addWidget(name_label)
-        layout.addStretch()
+        if 'retry' in actions:
+            if menu.actions():
+                menu.addSeparator()
+            retry_action = menu.addAction(
+                cached_icon('fa5s.redo', '#f59e0b'),
+                "Retry Classification"
+            )
+            retry_action.triggered.connect(lambda: self._run_action('retry'))
         
-        return widget
-    
-    def _get_file_icon(self, filename: str):
-        """Get appropriate icon based on file extension"""
-        extension = filename.split('.')[-1].lower() if '.' in filename else ''
+        if 'change_classification' in actions:
+            if menu.actions() and 'retry' not in actions:
+                menu.addSeparator()
+            change_action = menu.addAction(
+                cached_icon('fa5s.tag', '#6366f1'),
+                "Change Classification"
+            )
+            change_action.triggered.connect(lambda: self._run_action('change_classification'))
         
-        icon_map = {
-            'pdf': ('fa5s.file-pdf', '#ef4444'),
-            'doc': ('fa5s.file-word', '#3b82f6'),
-            'docx': ('fa5s.file-word', '#3b82f6'),
-            'xls': ('fa5s.file-excel', '#10b981'),
-            'xlsx': ('fa5s.file-excel', '#10b981'),
-            'ppt': ('fa5s.file-powerpoint', '#f59e0b'),
-            'pptx': ('fa5s.file-powerpoint', '#f59e0b'),
-            'txt': ('fa5s.file-alt', '#6b7280'),
-            'jpg': ('fa5s.file-image', '#8b5cf6'),
-            'jpeg': ('fa5s.file-image', '#8b5cf6'),
-            'png': ('fa5s.file-image', '#8b5cf6'),
-            'zip': ('fa5s.file-archive', '#f59e0b'),
-            'rar': ('fa5s.file-archive', '#f59e0b'),
-        }
+        if 'delete' in actions:
+            if menu.actions():  # Only add separator if there are other actions
+                menu.addSeparator()
+            delete_action = menu.addAction(
+                cached_icon('fa5s.trash-alt', '#ef4444'), 
+                "Delete"
+            )
+            delete_action.triggered.connect(lambda: self._run_action('delete'))
         
-        icon_name, color = icon_map.get(extension, ('fa5s.file', '#6b7280'))
-        return qta.icon(icon_name, color=color)
+        return menu
@@ -3,96 +3,132 @@ from PyQt6.QtCore import Qt
 import qtawesome as qta
 
 class DocumentTable(QTableWidget):
+    COLUMN_WIDTH = 150
+    # Fits the four action buttons
+    ACTIONS_COLUMN_WIDTH = 160
+
     def __init__(self, headers, parent=None):
         super().__init__(parent)
         self.headers = headers
         self.setColumnCount(len(self.headers))
         self.setHorizontalHeaderLabels(self.headers)
         vertical_header = self.verticalHeader()
-        if vertical_header:
+        if vertical_header is not None:
             vertical_header.setVisible(False)
         self.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
         self.setAlternatingRowColors(True)
 
+        # Cells are cloned from this centered item rather than built and
+        # aligned one by one
+        self._centered_prototype = QTableWidgetItem()
+        self._centered_prototype.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        # Only the filename column stretches; the others keep explicit widths
+        # so resizes don't re-measure the action buttons in every row
         header = self.horizontalHeader()
-        if header:
+        if header is not None:
+            last = len(self.headers) - 1
             header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
-            header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(len(self.headers) - 1, QHeaderView.ResizeMode.ResizeToContents)
+            header.setMinimumSectionSize(50)
+            header.setStretchLastSection(False)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            for column in range(1, last):
+                header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+                self.setColumnWidth(column, self.COLUMN_WIDTH)
+            header.setSectionResizeMode(last, QHeaderView.ResizeMode.Fixed)
+            self.setColumnWidth(last, self.ACTIONS_COLUMN_WIDTH)
 
     def set_documents(self, documents, action_callbacks):
-        self.setRowCount(len(documents))
-        for row, doc in enumerate(documents):
-            # Skip ID column - start from filename
-            doc_item = QTableWidgetItem(doc.get('filename', ''))
-            doc_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 0, doc_item)
+        self._action_callbacks = action_callbacks
+        # Repaint once after the whole fill rather than after every row
+        self.setUpdatesEnabled(False)
+        try:
+            self.setRowCount(len(documents))
+            for row, doc in enumerate(documents):
+                # Skip ID column - start from filename
+                self.setItem(row, 0, self._centered_item(doc.get('filename', '')))
 
-            # Classification column - status-aware display
-            classification = doc.get('classification', '')
-            classification_status = doc.get('classification_status', 'completed')
-            classification_error = doc.get('classification_error', '')
+                # Classification column - status-aware display
+                classification = doc.get('classification', '')
+                classification_status = doc.get('classification_status', 'completed')
+                classification_error = doc.get('classification_error', '')
 
-            if classification_status in ('queued', 'extracting_text', 'classifying'):
-                class_item = QTableWidgetItem('Classifying...')
-                class_item.setForeground(Qt.GlobalColor.gray)
-                class_item.setToolTip('Classification in progress')
-            elif classification_status == 'failed':
-                class_item = QTableWidgetItem('Failed')
-                class_item.setForeground(Qt.GlobalColor.red)
-                class_item.setToolTip(classification_error or 'Classification failed')
-            elif classification_status == 'completed' and classification.lower() == 'unclassified':
-                class_item = QTableWidgetItem('Needs Review')
-                class_item.setForeground(Qt.GlobalColor.darkYellow)
-                class_item.setToolTip('Classification completed but result is unclassified')
-            else:
-                class_item = QTableWidgetItem(classification)
-            class_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 1, class_item)
+                if classification_status in ('queued', 'extracting_text', 'classifying'):
+                    class_item = self._centered_item('Classifying...')
+                    class_item.setForeground(Qt.GlobalColor.gray)
+                    class_item.setToolTip('Classification in progress')
+                elif classification_status == 'failed':
+                    class_item = self._centered_item('Failed')
+                    class_item.setForeground(Qt.GlobalColor.red)
+                    class_item.setToolTip(classification_error or 'Classification failed')
+                elif classification_status == 'completed' and classification.lower() == 'unclassified':
+                    class_item = self._centered_item('Needs Review')
+                    class_item.setForeground(Qt.GlobalColor.darkYellow)
+                    class_item.setToolTip('Classification completed but result is unclassified')
+                else:
+                    class_item = self._centered_item(classification)
+                self.setItem(row, 1, class_item)
             
-            owner = doc.get('owner')
-            if owner and isinstance(owner, dict):
-                owner_item = QTableWidgetItem(owner.get('username', ''))
-            elif owner:
-                owner_item = QTableWidgetItem(str(owner))
-            else:
-                owner_item = QTableWidgetItem('')
-            owner_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 2, owner_item)
+                owner = doc.get('owner')
+                if owner and isinstance(owner, dict):
+                    owner_text = owner.get('username', '')
+                elif owner:
+                    owner_text = str(owner)
+                else:
+                    owner_text = ''
+                self.setItem(row, 2, self._centered_item(owner_text))
 
-            date_item = QTableWidgetItem(doc.get('upload_date', '').split('T')[0])
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.setItem(row, 3, date_item)
+                self.setItem(row, 3, self._centered_item(doc.get('upload_date', '').split('T')[0]))
 
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(0, 0, 0, 0)
-            actions_layout.setSpacing(5)
+                actions_widget = QWidget()
+                actions_layout = QHBoxLayout(actions_widget)
+                actions_layout.setContentsMargins(0, 0, 0, 0)
+                actions_layout.setSpacing(5)
 
-            if 'view' in action_callbacks:
-                view_button = QPushButton(qta.icon('fa5s.eye', color='blue'), "")
-                view_button.setToolTip("View Document")
-                view_button.clicked.connect(lambda _, r=row: action_callbacks['view'](r))
-                actions_layout.addWidget(view_button)
+                if 'view' in action_callbacks:
+                    view_button = QPushButton(qta.icon('fa5s.eye', color='blue'), "")
+                    view_button.setToolTip("View Document")
+                    view_button.setProperty("row", row)
+                    view_button.setProperty("action", "view")
+                    view_button.clicked.connect(self._on_action_clicked)
+                    actions_layout.addWidget(view_button)
 
-            if 'download' in action_callbacks:
-                download_button = QPushButton(qta.icon('fa5s.download', color='green'), "")
-                download_button.setToolTip("Download Document")
-                download_button.clicked.connect(lambda _, r=row: action_callbacks['download'](r))
-                actions_layout.addWidget(download_button)
+                if 'download' in action_callbacks:
+                    download_button = QPushButton(qta.icon('fa5s.download', color='green'), "")
+                    download_button.setToolTip("Download Document")
+                    download_button.setProperty("row", row)
+                    download_button.setProperty("action", "download")
+                    download_button.clicked.connect(self._on_action_clicked)
+                    actions_layout.addWidget(download_button)
 
-            if 'share' in action_callbacks:
-                share_button = QPushButton(qta.icon('fa5s.share', color='orange'), "")
-                share_button.setToolTip("Share Document")
-                share_button.clicked.connect(lambda _, r=row: action_callbacks['share'](r))
-                actions_layout.addWidget(share_button)
+                if 'share' in action_callbacks:
+                    share_button = QPushButton(qta.icon('fa5s.share', color='orange'), "")
+                    share_button.setToolTip("Share Document")
+                    share_button.setProperty("row", row)
+                    share_button.setProperty("action", "share")
+                    share_button.clicked.connect(self._on_action_clicked)
+                    actions_layout.addWidget(share_button)
             
-            if 'delete' in action_callbacks:
-                delete_button = QPushButton(qta.icon('fa5s.trash', color='red'), "")
-                delete_button.setToolTip("Delete Document")
-                delete_button.clicked.connect(lambda _, r=row: action_callbacks['delete'](r))
-                actions_layout.addWidget(delete_button)
+                if 'delete' in action_callbacks:
+                    delete_button = QPushButton(qta.icon('fa5s.trash', color='red'), "")
+                    delete_button.setToolTip("Delete Document")
+                    delete_button.setProperty("row", row)
+                    delete_button.setProperty("action", "delete")
+                    delete_button.clicked.connect(self._on_action_clicked)
+                    actions_layout.addWidget(delete_button)
+
+                self.setCellWidget(row, len(self.headers) - 1, actions_widget)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _centered_item(self, text):
+        item = self._centered_prototype.clone()
+        item.setText(text)
+        return item
 
-            self.setCellWidget(row, len(self.headers) - 1, actions_widget)
+    def _on_action_clicked(self):
+        # One slot serves every row's buttons; each button names its row and action
+        button = self.sender()
+        self._action_callbacks[button.property("action")](button.property("row"))
@@ -10,19 +10,29 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor
 from api.client import APIClient
+from workers.api_worker import run_api_call
 import qtawesome as qta
 
 
 class UserSearchWidget(QWidget):
     """Widget for searching and selecting users"""
     
+    SEARCH_DEBOUNCE_MS = 250
+    PAGE_SIZE = 20
+    
     def __init__(self, api_client: APIClient, parent=None):
         super().__init__(parent)
         self.api_client = api_client
         self.selected_user = None
-        self.users_cache = []
+        # The server filters and pages the directory; only the pages scrolled
+        # into the list are ever fetched
+        self._query = ""
+        self._last_user_id = None
+        self._has_more = False
+        # Bumped per request; responses to anything but the latest are stale
+        self._request_id = 0
         self.setup_ui()
-        self.load_users()
+        self.filter_users()
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -45,7 +55,13 @@ class UserSearchWidget(QWidget):
                 outline: none;
             }
         """)
-        self.search_input.textChanged.connect(self.on_search_changed)
+        # Restart a single-shot timer per keystroke so the list is filtered
+        # once typing settles
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.filter_users)
+        self.search_input.textChanged.connect(self._search_timer.start)
         layout.addWidget(self.search_input)
         
         # Results list
@@ -70,6 +86,7 @@ class UserSearchWidget(QWidget):
             }
         """)
         self.results_list.itemClicked.connect(self.on_user_selected)
+        self.results_list.verticalScrollBar().valueChanged.connect(self._on_results_scrolled)
         layout.addWidget(self.results_list)
         
         # Selected user display
@@ -85,34 +102,57 @@ class UserSearchWidget(QWidget):
         """)
         layout.addWidget(self.selected_label)
     
-    def load_users(self):
-        """Load all users from API"""
-        try:
-            self.users_cache = self.api_client.get_users()
-            self.populate_list(self.users_cache)
-        except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Error", f"Failed to load users: {e}")
+    def filter_users(self):
+        """Show the first page of users matching the current search text"""
+        self._query = self.search_input.text().strip()
+        self._has_more = False
+        self._load_page(after_id=None)
+    
+    def _load_page(self, after_id):
+        """Fetch one page of matches in the background"""
+        self._request_id += 1
+        request_id = self._request_id
+        run_api_call(self.api_client.search_users, self._query, self.PAGE_SIZE, after_id,
+                     on_done=lambda users: self._on_page_loaded(request_id, after_id, users),
+                     on_error=lambda message: self._on_page_error(request_id, message))
     
-    def on_search_changed(self, text):
-        """Filter users based on search text"""
-        if not text:
-            self.populate_list(self.users_cache)
+    def _on_page_loaded(self, request_id, after_id, users):
+        if request_id != self._request_id:
+            return  # Superseded by a newer search
+        users = users or []
+        # A short page is the last one
+        self._has_more = len(users) == self.PAGE_SIZE
+        if users:
+            self._last_user_id = users[-1]['id']
+        if after_id is None:
+            # First page of a new search: replace the previous results, which
+            # stay visible until now rather than blanking while typing
+            self.populate_list(users)
+            # Otherwise the old scroll position is clamped to the new page's
+            # maximum on the next layout, which reads as scrolled to the bottom
+            self.results_list.verticalScrollBar().setValue(0)
+        else:
+            self.append_users(users)
+    
+    def _on_page_error(self, request_id, message):
+        if request_id != self._request_id:
             return
-        
-        text_lower = text.lower()
-        filtered = [
-            user for user in self.users_cache
-            if (text_lower in user.get('username', '').lower() or
-                text_lower in user.get('first_name', '').lower() or
-                text_lower in user.get('last_name', '').lower() or
-                text_lower in user.get('email', '').lower())
-        ]
-        self.populate_list(filtered)
+        self._has_more = False
+        QMessageBox.warning(self, "Error", f"Failed to load users: {message}")
+    
+    def _on_results_scrolled(self, value):
+        """Fetch the next page once the list is scrolled to the bottom"""
+        if self._has_more and value == self.results_list.verticalScrollBar().maximum():
+            self._has_more = False
+            self._load_page(after_id=self._last_user_id)
     
     def populate_list(self, users):
         """Populate the list widget with users"""
         self.results_list.clear()
+        self.append_users(users)
+    
+    def append_users(self, users):
+        """Add users to the end of the list widget"""
         for user in users:
             item_text = f"{user.get('first_name', '')} {user.get('last_name', '')} (@{user.get('username', '')}) - {user.get('email', '')}"
             item = QListWidgetItem(item_text)
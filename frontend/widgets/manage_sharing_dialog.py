@@ -10,8 +10,13 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 from api.client import APIClient
+from workers.api_worker import run_api_call
 import qtawesome as qta
 
+# Row text colors, built once instead of per table cell
+_NAME_COLOR = QColor('#0f1016')
+_MUTED_COLOR = QColor('#6b7280')
+
 
 class ManageSharingDialog(QDialog):
     """Dialog for managing document sharing permissions"""
@@ -21,6 +26,8 @@ class ManageSharingDialog(QDialog):
         self.document = document
         self.api_client = api_client
         self.permissions = []
+        self._permissions_loading = False
+        self._permissions_reload_pending = False
         self.setup_ui()
         self.load_permissions()
     
@@ -79,8 +86,11 @@ class ManageSharingDialog(QDialog):
         self.table.setShowGrid(False)
         
         v_header = self.table.verticalHeader()
-        if v_header:
+        if v_header is not None:
             v_header.setVisible(False)
+            # Every row is 80px tall: fix it once instead of per row
+            v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            v_header.setDefaultSectionSize(80)
         
         # Column widths
         header = self.table.horizontalHeader()
@@ -188,22 +198,41 @@ class ManageSharingDialog(QDialog):
         """)
     
     def load_permissions(self):
-        """Load permissions from API"""
-        try:
-            self.permissions = self.api_client.get_document_permissions(self.document['id'])
-            self.populate_table()
-            
-            if self.permissions:
-                self.info_label.setText(f"Shared with {len(self.permissions)} user(s)")
-            else:
-                self.info_label.setText("This document is not shared with anyone yet")
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to load permissions: {str(e)}"
-            )
-            self.info_label.setText("Error loading permissions")
+        """Load permissions from API in the background"""
+        # One request at a time; a reload asked for meanwhile reruns once the
+        # current one reports back, so its result is never overwritten by an
+        # older response
+        if self._permissions_loading:
+            self._permissions_reload_pending = True
+            return
+        self._permissions_loading = True
+        run_api_call(self.api_client.get_document_permissions, self.document['id'],
+                     on_done=self._on_permissions_loaded,
+                     on_error=self._on_permissions_load_error)
+    
+    def _on_permissions_loaded(self, permissions):
+        self._permissions_loading = False
+        if self._permissions_reload_pending:
+            self._permissions_reload_pending = False
+            self.load_permissions()
+            return
+        self.permissions = permissions or []
+        self.populate_table()
+        
+        if self.permissions:
+            self.info_label.setText(f"Shared with {len(self.permissions)} user(s)")
+        else:
+            self.info_label.setText("This document is not shared with anyone yet")
+    
+    def _on_permissions_load_error(self, message):
+        self._permissions_loading = False
+        self._permissions_reload_pending = False
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Failed to load permissions: {message}"
+        )
+        self.info_label.setText("Error loading permissions")
     
     def populate_table(self):
         """Populate the table with permissions"""
@@ -215,14 +244,14 @@ class ManageSharingDialog(QDialog):
             # User name
             name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
             name_item = QTableWidgetItem(name)
-            name_item.setForeground(QColor('#0f1016'))
+            name_item.setForeground(_NAME_COLOR)
             name_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.table.setItem(row, 0, name_item)
             
             # Email
             email = user.get('email', '')
             email_item = QTableWidgetItem(email)
-            email_item.setForeground(QColor('#6b7280'))
+            email_item.setForeground(_MUTED_COLOR)
             email_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.table.setItem(row, 1, email_item)
             
@@ -288,9 +317,6 @@ class ManageSharingDialog(QDialog):
             actions_layout.addWidget(revoke_btn)
             
             self.table.setCellWidget(row, 3, actions_widget)
-            
-            # Set row height - increased for better spacing
-            self.table.setRowHeight(row, 80)
     
     def update_permission(self, permission: dict, new_level: str):
         """Update permission level"""
@@ -0,0 +1,58 @@
+"""
+Background execution of blocking APIClient calls.
+
+APIClient uses a synchronous requests session, so views hand each call to
+run_api_call() instead of making it on the GUI thread; the callbacks are
+delivered back on the GUI thread through queued signals.
+"""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class ApiSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ApiWorker(QRunnable):
+    """Runs one APIClient call on the shared QThreadPool.
+
+    QRunnable cannot emit signals itself, so results go through `signals`.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = ApiSignals()
+        self.setAutoDelete(False)  # The owner holds the reference until it reports
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+# Workers stay referenced here until they report back
+_active_workers = set()
+
+
+def run_api_call(fn, *args, on_done, on_error=None):
+    """Run `fn(*args)` on the shared QThreadPool; callbacks fire on the GUI thread."""
+    worker = ApiWorker(fn, *args)
+    _active_workers.add(worker)
+
+    def finished(result):
+        _active_workers.discard(worker)
+        on_done(result)
+
+    def failed(message):
+        _active_workers.discard(worker)
+        if on_error:
+            on_error(message)
+
+    worker.signals.finished.connect(finished)
+    worker.signals.error.connect(failed)
+    QThreadPool.globalInstance().start(worker)